@@ -22,7 +22,7 @@ try:
 except Exception:  # pragma: no cover
     APIConnectionError = APITimeoutError = APIStatusError = RateLimitError = Exception  # type: ignore
 
-from core.config import AppSettings
+from core.config import AppSettings, get_settings
 from core.domain.language import Language
 from core.domain.models import AnalysisReport, PersonEntity
 
@@ -154,7 +154,7 @@ async def analyze_person(
 ) -> AnalysisReport:
     """Genera un reporte de análisis IA a partir de evidencias públicas."""
 
-    settings = settings or AppSettings()
+    settings = settings or get_settings()
     
     clean_person = person.model_copy()
     
@@ -182,7 +182,7 @@ async def analyze_person(
     # Preparación de evidencia normalizada (best-effort).
     profiles_data = []
     for p in clean_person.profiles:
-        meta = p.metadata if isinstance(p.metadata, dict) else {}
+        meta = p.metadata
         
         # Normaliza URL (evita querystrings ruidosas).
         clean_url = str(p.url).split('?')[0]
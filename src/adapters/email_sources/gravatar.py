@@ -15,8 +15,10 @@ from __future__ import annotations
 import hashlib
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+import httpx
+
+from adapters.http_client import client_scope
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
@@ -28,8 +30,13 @@ def _normalize_email(email: str) -> str:
 class GravatarScanner(OSINTScanner):
     _base_url = "https://www.gravatar.com"
 
-    def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+    def __init__(
+        self,
+        settings: AppSettings | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._client = client
 
     async def scan(self, username: str) -> SocialProfile:
         email = _normalize_email(username)
@@ -39,22 +46,23 @@ class GravatarScanner(OSINTScanner):
         # `d=404` hace que el recurso devuelva 404 si no existe.
         avatar_url = f"{self._base_url}/avatar/{email_md5}?s=200&d=404"
 
-        async with build_async_client(self._settings) as client:
+        async with client_scope(self._client, self._settings) as client:
             response = await client.get(avatar_url)
 
+        final_url = str(response.url)
         exists = response.status_code == 200
         metadata: dict[str, Any] = {
             "status_code": response.status_code,
-            "final_url": str(response.url),
+            "final_url": final_url,
             "email_md5": email_md5,
             "normalized_email": email,
         }
 
         return SocialProfile(
-            url=str(response.url),
+            url=final_url,
             username=email,
             network_name="gravatar",
             existe=exists,
             metadata=metadata,
-            imagen_url=str(response.url) if exists else None,
+            imagen_url=final_url if exists else None,
         )
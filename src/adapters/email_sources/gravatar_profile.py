@@ -11,8 +11,10 @@ import hashlib
 import json
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+import httpx
+
+from adapters.http_client import client_scope
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
@@ -28,8 +30,13 @@ def _email_md5(email: str) -> str:
 class GravatarProfileScanner(OSINTScanner):
     _base_url = "https://en.gravatar.com"
 
-    def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+    def __init__(
+        self,
+        settings: AppSettings | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._client = client
 
     async def scan(self, username: str) -> SocialProfile:
         email = _normalize_email(username)
@@ -37,13 +44,14 @@ class GravatarProfileScanner(OSINTScanner):
 
         url = f"{self._base_url}/{h}.json"
 
-        async with build_async_client(self._settings) as client:
+        async with client_scope(self._client, self._settings) as client:
             response = await client.get(url)
 
+        final_url = str(response.url)
         exists = response.status_code == 200
         metadata: dict[str, Any] = {
             "status_code": response.status_code,
-            "final_url": str(response.url),
+            "final_url": final_url,
             "email_md5": h,
             "normalized_email": email,
         }
@@ -76,7 +84,7 @@ class GravatarProfileScanner(OSINTScanner):
                 metadata["parse_error"] = str(exc)
 
         return SocialProfile(
-            url=str(response.url),
+            url=final_url,
             username=email,
             network_name="gravatar_profile",
             existe=exists,
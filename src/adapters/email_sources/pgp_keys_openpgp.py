@@ -12,8 +12,10 @@ from __future__ import annotations
 from typing import Any
 from urllib.parse import quote
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+import httpx
+
+from adapters.http_client import client_scope
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
@@ -21,16 +23,22 @@ from core.interfaces.scanner import OSINTScanner
 class OpenPGPKeysScanner(OSINTScanner):
     _base_url = "https://keys.openpgp.org"
 
-    def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+    def __init__(
+        self,
+        settings: AppSettings | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._client = client
 
     async def scan(self, username: str) -> SocialProfile:
         email = username.strip().lower()
         url = f"{self._base_url}/search?q={quote(email)}"
 
-        async with build_async_client(self._settings) as client:
+        async with client_scope(self._client, self._settings) as client:
             response = await client.get(url)
 
+        final_url = str(response.url)
         text = response.text or ""
         # Heurística: si no hay claves, suele aparecer un mensaje de "No results".
         not_found_markers = ["No results", "No keys found", "No matching keys"]
@@ -38,12 +46,12 @@ class OpenPGPKeysScanner(OSINTScanner):
 
         metadata: dict[str, Any] = {
             "status_code": response.status_code,
-            "final_url": str(response.url),
+            "final_url": final_url,
             "heuristic": "content",
         }
 
         return SocialProfile(
-            url=str(response.url),
+            url=final_url,
             username=email,
             network_name="openpgp_keys",
             existe=found,
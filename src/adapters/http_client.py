@@ -9,43 +9,109 @@ Nota: implementación pendiente (solo andamiaje).
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 from urllib.parse import urljoin
 
 import httpx
 
-from core.config import AppSettings
+from core.config import AppSettings, get_settings
 
 try:
-    from bs4 import BeautifulSoup
+    import hishel
+except ImportError:  # pragma: no cover
+    hishel = None  # type: ignore
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
 except Exception:  # pragma: no cover
     BeautifulSoup = None  # type: ignore
+    SoupStrainer = None  # type: ignore
+
+# Solo construimos en el árbol los nodos que leemos: el resto del documento
+# se tokeniza pero no se materializa (menos objetos por página).
+_METADATA_STRAINER = SoupStrainer(["title", "meta"]) if SoupStrainer is not None else None
 
 
 def build_async_client(
     settings: AppSettings | None = None,
     *,
     extra_headers: dict[str, str] | None = None,
+    limits: httpx.Limits | None = None,
 ) -> httpx.AsyncClient:
     """Crea un `httpx.AsyncClient` con defaults seguros.
 
     Por qué un builder:
     - Centraliza timeouts/headers para que todas las fuentes se comporten igual.
     - Facilita testeo y futuras políticas (retries, proxies, Tor).
+
+    Caché HTTP (opcional):
+    - Con `http_cache_dir` configurado y `hishel` instalado, las respuestas se
+      guardan en disco y se revalidan con ETag/Last-Modified: un perfil sin
+      cambios vuelve como 304 sin body.
     """
 
-    settings = settings or AppSettings()
+    settings = settings or get_settings()
     headers: dict[str, str] = {
         "User-Agent": settings.user_agent,
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
     if extra_headers:
         headers.update(extra_headers)
-    return httpx.AsyncClient(
-        timeout=httpx.Timeout(settings.http_timeout_seconds),
-        follow_redirects=True,
-        headers=headers,
-    )
+    kwargs: dict[str, Any] = {
+        "timeout": httpx.Timeout(settings.http_timeout_seconds),
+        "follow_redirects": True,
+        "headers": headers,
+    }
+    # Sin `limits`, httpx aplica su pool acotado por defecto (100 conexiones,
+    # 20 keep-alive); `httpx.Limits()` a secas no tendría tope.
+    if limits is not None:
+        kwargs["limits"] = limits
+    if settings.http_cache_dir is not None and hishel is not None:
+        return hishel.AsyncCacheClient(
+            storage=hishel.AsyncFileStorage(base_path=settings.http_cache_dir),
+            controller=hishel.Controller(allow_stale=True),
+            **kwargs,
+        )
+    return httpx.AsyncClient(**kwargs)
+
+
+@asynccontextmanager
+async def client_scope(
+    client: httpx.AsyncClient | None,
+    settings: AppSettings | None = None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Usa el cliente compartido si existe; si no, crea uno efímero.
+
+    Por qué:
+    - Los orquestadores inyectan un único cliente para que N scans reutilicen
+      el pool de conexiones (DNS + TCP + TLS una sola vez por host).
+    - Solo cerramos el cliente cuando lo creamos aquí.
+    """
+
+    if client is not None:
+        yield client
+        return
+    async with build_async_client(settings) as owned:
+        yield owned
+
+
+async def probe_status(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """Comprueba un perfil sin descargar el body (HEAD, con fallback a GET ranged).
+
+    Por qué:
+    - Los scanners que solo miran el status code no necesitan el HTML
+      (decenas/centenas de KB por perfil).
+    - Algunos servidores rechazan HEAD (405/501): reintentamos con
+      `Range: bytes=0-0`, que devuelve 206 si el recurso existe.
+    """
+
+    response = await client.head(url)
+    if response.status_code in (405, 501):
+        response = await client.get(url, headers={"Range": "bytes=0-0"})
+    return response
 
 
 def extract_html_metadata(*, html: str, base_url: str | None = None) -> dict[str, Any]:
@@ -65,7 +131,7 @@ def extract_html_metadata(*, html: str, base_url: str | None = None) -> dict[str
     if BeautifulSoup is None:
         return {}
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "html.parser", parse_only=_METADATA_STRAINER)
 
     title = None
     if soup.title and soup.title.string:
@@ -91,3 +157,28 @@ def extract_html_metadata(*, html: str, base_url: str | None = None) -> dict[str
     if og_image:
         out["og_image"] = og_image
     return out
+
+
+# Páginas de error / soft-404 devuelven el mismo HTML para muchos usernames.
+# La clave usa hash+longitud del body (no el body) para no retener cientos
+# de páginas en memoria; `str.__hash__` queda cacheado en el propio objeto.
+_METADATA_CACHE: OrderedDict[tuple[str | None, int, int], dict[str, Any]] = OrderedDict()
+_METADATA_CACHE_MAXSIZE = 1024
+
+
+def cached_html_metadata(*, html: str, base_url: str | None = None) -> dict[str, Any]:
+    """Como `extract_html_metadata`, pero memoizado por `(base_url, body)`.
+
+    Devuelve una copia: el llamador puede mutarla sin afectar a la caché.
+    """
+
+    key = (base_url, hash(html), len(html))
+    meta = _METADATA_CACHE.get(key)
+    if meta is None:
+        meta = extract_html_metadata(html=html, base_url=base_url)
+        _METADATA_CACHE[key] = meta
+        if len(_METADATA_CACHE) > _METADATA_CACHE_MAXSIZE:
+            _METADATA_CACHE.popitem(last=False)
+    else:
+        _METADATA_CACHE.move_to_end(key)
+    return dict(meta)
@@ -7,19 +7,19 @@ Por qué JSON:
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from core.domain.models import PersonEntity
 
 
 def export_person_json(*, person: PersonEntity, output_path: Path) -> Path:
-    """Exporta `PersonEntity` a JSON UTF-8 con formato estable."""
+    """Exporta `PersonEntity` a JSON UTF-8 con formato estable.
+
+    `model_dump_json` serializa en Rust directamente a UTF-8, sin pasar por el
+    dict intermedio ni por el encoder en Python de `json.dumps(indent=...)`.
+    Las claves siguen el orden de declaración de los modelos (determinista).
+    """
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    payload = person.model_dump(mode="json")
-    output_path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    output_path.write_bytes(person.model_dump_json(indent=2).encode("utf-8") + b"\n")
     return output_path
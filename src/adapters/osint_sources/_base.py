@@ -0,0 +1,147 @@
+"""Base común para scanners "petición al perfil + status code".
+
+Por qué:
+- Casi todas las fuentes repetían el mismo esqueleto: construir la URL, pedir
+  con el cliente (compartido o efímero), capturar status/final_url y montar el
+  `SocialProfile`.
+- Centralizarlo hace que cualquier mejora (cliente compartido, HEAD, caché)
+  llegue a todas las fuentes a la vez.
+
+Cada scanner concreto declara:
+- `base_url`, `network_name` y, si no es `<base_url>/<username>`, `url_pattern`
+  (ver `profile_url`).
+- `needs_body = False` si solo importa el status (se usa HEAD, ver
+  `probe_status`).
+- `prefix_bytes` + `_prefix_is_enough(html)` para pedir solo el inicio del
+  documento (`Range`) cuando lo que se parsea vive en el `<head>`.
+- `_parse(response, metadata)` para leer el HTML de un 200 y confirmar la
+  existencia real del perfil.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, ClassVar
+
+import httpx
+
+from adapters.http_client import client_scope, probe_status
+from adapters.scan_cache import cached_scan
+from core.config import AppSettings, get_settings
+from core.domain.models import SocialProfile
+from core.interfaces.scanner import OSINTScanner
+
+
+# Una sola pasada para las meta tags que leen los scanners (og:title, og:image,
+# description, title) en vez de un regex por tag.
+_META_RE = re.compile(
+    r'<meta\s+(?:property|name)="(og:title|og:image|description|title)"\s+content="([^"]*)"',
+    re.IGNORECASE,
+)
+
+
+def meta_tags(html: str) -> dict[str, str]:
+    """Devuelve `{nombre: content}` de las meta tags conocidas (primera aparición)."""
+
+    found: dict[str, str] = {}
+    for m in _META_RE.finditer(html):
+        found.setdefault(m.group(1).lower(), m.group(2))
+    return found
+
+
+def find_title(html: str) -> str | None:
+    """Devuelve el contenido del primer `<title>` (o None).
+
+    `str.find` en vez de regex: el tag es único y está al principio, y la
+    búsqueda de subcadenas de CPython es mucho más rápida que el motor de `re`.
+    """
+
+    start = html.find("<title>")
+    if start == -1:
+        return None
+    start += len("<title>")
+    end = html.find("</title>", start)
+    if end == -1:
+        return None
+    return html[start:end]
+
+
+class StatusProbeScanner(OSINTScanner):
+    base_url: ClassVar[str]
+    network_name: ClassVar[str]
+    url_pattern: ClassVar[str] = "{base_url}/{username}"
+    needs_body: ClassVar[bool] = True
+    prefix_bytes: ClassVar[int | None] = None
+
+    def __init__(
+        self,
+        settings: AppSettings | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._client = client
+
+    def profile_url(self, username: str) -> str:
+        """URL pública del perfil (la usa también el fallback de errores del pipeline)."""
+
+        return self.url_pattern.format(base_url=self.base_url, username=username)
+
+    @cached_scan()
+    async def scan(self, username: str) -> SocialProfile | list[SocialProfile]:
+        url = self.profile_url(username)
+
+        async with client_scope(self._client, self._settings) as client:
+            if not self.needs_body:
+                response = await probe_status(client, url)
+            elif self.prefix_bytes:
+                response = await client.get(
+                    url, headers={"Range": f"bytes=0-{self.prefix_bytes - 1}"}
+                )
+                # 206 incompleto (o Range rechazado): GET completo. Un 200
+                # significa que el servidor ignoró el Range y ya tenemos todo.
+                if response.status_code == 416 or (
+                    response.status_code == 206 and not self._prefix_is_enough(response.text)
+                ):
+                    response = await client.get(url)
+            else:
+                response = await client.get(url)
+
+        final_url = str(response.url)
+        metadata: dict[str, Any] = {
+            "status_code": response.status_code,
+            "final_url": final_url,
+        }
+        # 206: respuesta a un GET ranged (`probe_status` o `prefix_bytes`).
+        exists = response.status_code in (200, 206)
+        if exists and self.needs_body:
+            exists = self._parse(response, metadata)
+
+        profile = SocialProfile(
+            url=final_url,
+            username=username,
+            network_name=self.network_name,
+            existe=exists,
+            metadata=metadata,
+        )
+        extra_profiles = self._extra_profiles(profile)
+        if extra_profiles:
+            return [profile, *extra_profiles]
+        return profile
+
+    def _parse(self, response: httpx.Response, metadata: dict[str, Any]) -> bool:
+        """Hook: completa `metadata` desde el body y confirma la existencia.
+
+        Solo se llama con status 200/206. Por defecto, el status basta.
+        """
+
+        return True
+
+    def _prefix_is_enough(self, html: str) -> bool:
+        """Hook: indica si el prefijo descargado basta para `_parse`."""
+
+        return False
+
+    def _extra_profiles(self, profile: SocialProfile) -> list[SocialProfile]:
+        """Hook: perfiles adicionales derivados del principal (p.ej. enlaces)."""
+
+        return []
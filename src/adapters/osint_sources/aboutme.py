@@ -6,131 +6,176 @@ Implementación mínima:
 
 from __future__ import annotations
 
+import json
+import os
+import re
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+import httpx
+
+from adapters.osint_sources._base import StatusProbeScanner, find_title
 from core.domain.models import SocialProfile
-from core.interfaces.scanner import OSINTScanner
-
-
-class AboutMeScanner(OSINTScanner):
-    _base_url = "https://about.me"
-
-    def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
-
-    async def scan(self, username: str) -> SocialProfile | list[SocialProfile]:
-        import re
-        url = f"{self._base_url}/{username}"
-
-        async with build_async_client(self._settings) as client:
-            response = await client.get(url)
-            
-
-        exists = response.status_code == 200
-        
-        metadata: dict[str, Any] = {
-            "status_code": response.status_code,
-            "final_url": str(response.url),
-        }
-        if exists:
-            html = response.text if hasattr(response, "text") else await response.aread()
-            if not isinstance(html, str):
-                html = html.decode(errors="ignore")
-                
-            #validamos existencia real del perfil con el div que contiene el nombre
-            pattern_exist_div = r'<title>(.*?)</title>'
-            ne = re.search(pattern_exist_div, html, re.IGNORECASE | re.DOTALL)
-            title= ne.group(1) if ne is not None else None
-            
-            if title is not None:
-                who = title.replace("| about.me", "").strip(" ·-")
-                metadata["name"] = who
-                # who = username userlastname - New Orleans, Louisiana
-                name= who.split(" - ")[0].strip()
-                metadata["name"]= name
-                
-                pattern_bio = r'"bio":"(.*?)",'
-                nb = re.search(pattern_bio, html, re.IGNORECASE | re.DOTALL)
-                bio= nb.group(1) if nb is not None else None
-                metadata["bio"] = bio
-                
-                pattern_desc = r'"description":"(.*?)",'
-                nd = re.search(pattern_desc, html, re.IGNORECASE | re.DOTALL)
-                description= nd.group(1) if nd is not None else None
-                metadata["description"] = description 
-                
-                pattern_avatar = r'"image":{"url":"(.*?)",'
-                na = re.search(pattern_avatar, html, re.IGNORECASE | re.DOTALL)
-                if na is not None:
-                    avatar_url = na.group(1)
-                    metadata["avatar_url"] = avatar_url
-        
-                pattern_location = r'"address":"(.*?)",' 
-                nl = re.search(pattern_location, html, re.IGNORECASE | re.DOTALL)
-                location= nl.group(1) if nl is not None else None
-                if location is None:
-                    location= who.split(" - ")[1].strip() if len(who.split(" - "))>1 else None
-                metadata["location"] = location
-                
-                pattern_job=r'"jobTitle":"(.*?)",'
-                nj= re.search(pattern_job, html, re.IGNORECASE | re.DOTALL)
-                job= nj.group(1) if nj is not None else None
-                metadata["jobTitle"] = job
-                
-                pattern_interests = r'"knowsAbout":\s*\[(.*?)\]'
-                ni = re.search(pattern_interests, html, re.IGNORECASE | re.DOTALL)
-                if ni:
-                    # Extrae todos los elementos entre comillas
-                    interests = re.findall(r'"(.*?)"', ni.group(1))
-                else:
-                    interests = None
-                metadata["interests"] = interests
-                
-                pattern_socials = r'"sameAs":\s*\[(.*?)\]'
-                ns = re.search(pattern_socials, html, re.IGNORECASE | re.DOTALL)
-                
-                social_links = []
-                if ns:
-                    # Extrae todos los elementos entre comillas
-                    social_links = re.findall(r'"(.*?)"', ns.group(1))
-                    
-                metadata["social_links"] = social_links
-                
-
-                
-            
-            
-            if name is not None:
-                exists = True
-                metadata["name"] = name
-                    
-
-        main_profile= SocialProfile(
-            url=str(response.url),
-            username=username,
-            network_name="aboutme",
-            existe=exists,
-            metadata=metadata,
-        )
-        
-         # Creamos perfiles adicionales para que aparezcan en la tabla
-        extra_profiles = []
-        
-        if "social_links" in metadata:
-            for link in metadata["social_links"]:
-                extra_profiles.append(SocialProfile(
+
+# RE2 (google-re2) es opcional: matching en tiempo lineal, sin backtracking
+# catastrófico con los `.*?` sobre HTML grande. `OSINT_D2_DISABLE_RE2=1`
+# fuerza el `re` de la stdlib.
+_re_engine: Any = re
+if os.environ.get("OSINT_D2_DISABLE_RE2", "").lower() not in {"1", "true", "yes"}:
+    try:
+        import re2 as _re_engine  # type: ignore[no-redef]
+    except ImportError:  # pragma: no cover
+        _re_engine = re
+
+
+def _compile(pattern: str) -> Any:
+    # Flags inline (`(?is)`): RE2 y `re` las entienden igual.
+    return _re_engine.compile(pattern)
+
+
+_LDJSON_RE = _compile(r'(?is)<script[^>]+type="application/ld\+json"[^>]*>(.*?)</script>')
+# Una sola alternancia para el fallback: una pasada sobre el HTML en vez de
+# una por campo. Cada rama captura en un grupo con el nombre de su clave.
+_INLINE_FIELDS_RE = _compile(
+    r'(?is)"bio":"(?P<bio>.*?)",'
+    r'|"description":"(?P<description>.*?)",'
+    r'|"image":\{"url":"(?P<avatar_url>.*?)",'
+    r'|"address":"(?P<location>.*?)",'
+    r'|"jobTitle":"(?P<jobTitle>.*?)",'
+    r'|"knowsAbout":\s*\[(?P<interests>.*?)\]'
+    r'|"sameAs":\s*\[(?P<social_links>.*?)\]'
+)
+_QUOTED_RE = _compile(r'"(.*?)"')
+# Igual que `SocialProfile.username` (max_length).
+_USERNAME_MAX_LENGTH = 128
+
+
+def _str_or_none(value: Any) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _str_list(value: Any) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    return [v for v in value if isinstance(v, str)]
+
+
+def _fields_from_ld_json(html: str) -> dict[str, Any] | None:
+    """Extrae los campos del perfil desde el bloque JSON-LD (si existe).
+
+    Un único regex localiza el bloque y `json.loads` hace el resto, en lugar
+    de recorrer el HTML completo una vez por campo.
+    """
+
+    m = _LDJSON_RE.search(html)
+    if m is None:
+        return None
+    try:
+        data = json.loads(m.group(1))
+    except ValueError:
+        return None
+    if isinstance(data, list):
+        data = next((d for d in data if isinstance(d, dict)), None)
+    if not isinstance(data, dict):
+        return None
+
+    image = data.get("image")
+    avatar_url = image.get("url") if isinstance(image, dict) else image
+    interests = _str_list(data.get("knowsAbout"))
+    return {
+        "bio": _str_or_none(data.get("bio")),
+        "description": _str_or_none(data.get("description")),
+        "avatar_url": _str_or_none(avatar_url),
+        "location": _str_or_none(data.get("address")),
+        "jobTitle": _str_or_none(data.get("jobTitle")),
+        "interests": interests or None,
+        "social_links": _str_list(data.get("sameAs")),
+    }
+
+
+def _fields_from_inline_json(html: str) -> dict[str, Any]:
+    """Fallback: busca las mismas claves en el JSON embebido del HTML."""
+
+    found: dict[str, str] = {}
+    for m in _INLINE_FIELDS_RE.finditer(html):
+        # Nos quedamos con la primera aparición de cada clave.
+        found.setdefault(m.lastgroup, m.group(m.lastgroup))
+
+    interests = found.get("interests")
+    social_links = found.get("social_links")
+    return {
+        "bio": found.get("bio"),
+        "description": found.get("description"),
+        "avatar_url": found.get("avatar_url"),
+        "location": found.get("location"),
+        "jobTitle": found.get("jobTitle"),
+        # Extrae todos los elementos entre comillas
+        "interests": _QUOTED_RE.findall(interests) if interests is not None else None,
+        "social_links": _QUOTED_RE.findall(social_links) if social_links is not None else [],
+    }
+
+
+class AboutMeScanner(StatusProbeScanner):
+    base_url = "https://about.me"
+    network_name = "aboutme"
+    # El <title> y el JSON-LD van en el <head>: normalmente caben aquí.
+    prefix_bytes = 4096
+
+    def _prefix_is_enough(self, html: str) -> bool:
+        return find_title(html) is not None and _LDJSON_RE.search(html) is not None
+
+    def _parse(self, response: httpx.Response, metadata: dict[str, Any]) -> bool:
+        html = response.text
+
+        #validamos existencia real del perfil con el div que contiene el nombre
+        title = find_title(html)
+        if title is None:
+            return True
+
+        who = title.replace("| about.me", "").strip(" ·-")
+        # who = username userlastname - New Orleans, Louisiana
+        name = who.split(" - ")[0].strip()
+        metadata["name"] = name
+
+        fields = _fields_from_ld_json(html)
+        if fields is None:
+            fields = _fields_from_inline_json(html)
+
+        metadata["bio"] = fields["bio"]
+        metadata["description"] = fields["description"]
+        if fields["avatar_url"] is not None:
+            metadata["avatar_url"] = fields["avatar_url"]
+
+        location = fields["location"]
+        if location is None:
+            location = who.split(" - ")[1].strip() if len(who.split(" - ")) > 1 else None
+        metadata["location"] = location
+
+        metadata["jobTitle"] = fields["jobTitle"]
+        metadata["interests"] = fields["interests"]
+        metadata["social_links"] = fields["social_links"]
+        return True
+
+    def _extra_profiles(self, profile: SocialProfile) -> list[SocialProfile]:
+        # Creamos perfiles adicionales para que aparezcan en la tabla.
+        # `model_construct` se salta la validación por enlace, así que aquí
+        # filtramos lo único que `SocialProfile` podría rechazar: el username
+        # (1..128 caracteres). Los enlaces vacíos (`""`) o con un último
+        # segmento enorme se descartan; si no, `analyze` no podría releer el JSON.
+        extra: list[SocialProfile] = []
+        for link in profile.metadata.get("social_links", []):
+            link = link.strip()
+            if not link:
+                continue
+            username = link.rstrip("/").rpartition("/")[2] or link
+            if len(username) > _USERNAME_MAX_LENGTH:
+                continue
+            extra.append(
+                SocialProfile.model_construct(
                     url=link,
-                    username=link.split("/")[-1],
+                    username=username,
                     network_name="aboutme_social_link",
                     existe=True,
-                    metadata={"source": "aboutme", "from_username": username},
-                ))
-                
-
-        # Retornamos todos los perfiles (el principal y los extras)
-        if extra_profiles:
-            return [main_profile] + extra_profiles
-        return main_profile
-
+                    metadata={"source": "aboutme", "from_username": profile.username},
+                )
+            )
+        return extra
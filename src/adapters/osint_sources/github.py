@@ -9,8 +9,11 @@ from __future__ import annotations
 
 from typing import Any
 
+import httpx
+
+from adapters.scan_cache import cached_scan
 from adapters.specific_scrapers import fetch_github_deep
-from core.config import AppSettings
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
@@ -20,11 +23,22 @@ class GitHubScanner(OSINTScanner):
 
     _base_url = "https://github.com"
 
-    def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+    def __init__(
+        self,
+        settings: AppSettings | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._client = client
+
+    def profile_url(self, username: str) -> str:
+        """URL pública del perfil (la usa también el fallback de errores del pipeline)."""
+
+        return f"{self._base_url}/{username}"
 
+    @cached_scan()
     async def scan(self, username: str) -> SocialProfile | list[SocialProfile]:
-        public_url = f"{self._base_url}/{username}"
+        public_url = self.profile_url(username)
 
         # Inicializar listas antes de cualquier uso
         other_emails: list[str] = []
@@ -33,7 +47,11 @@ class GitHubScanner(OSINTScanner):
         bio = None
         image_url = None
 
-        api = await fetch_github_deep(username=username, settings=self._settings)
+        api = await fetch_github_deep(
+            username=username,
+            settings=self._settings,
+            client=self._client,
+        )
         exists = api is not None
 
         if api:
@@ -9,78 +9,66 @@ Nota:
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
-from core.domain.models import SocialProfile
-from core.interfaces.scanner import OSINTScanner
+import httpx
 
+from adapters.osint_sources._base import StatusProbeScanner
 
-class PinterestScanner(OSINTScanner):
-    _base_url = "https://www.pinterest.com"
+# Anclamos en `data-test-id` (estable entre deploys) y no en las clases CSS
+# ofuscadas, que cambian con cada build de Pinterest.
+_NAME_RE = re.compile(
+    r'<div[^>]*data-test-id="profile-name"[^>]*>\s*<div[^>]*>([^<]*)</div>',
+    re.IGNORECASE,
+)
+_DESC_RE = re.compile(
+    r'<span[^>]*data-test-id="main-user-description-text"[^>]*>(.*?)</span>',
+    re.IGNORECASE | re.DOTALL,
+)
+# Independiente del nombre para poder precompilarlo; el `alt` se compara
+# después con el nombre del perfil.
+_AVATAR_RE = re.compile(
+    r'<img alt="([^"]*)" class="iFOUS5"[^>]*? src="([^"]*)"',
+    re.IGNORECASE,
+)
+_WEBSITE_RE = re.compile(
+    r'<span class="WuRgKB eMU5i5 YfEt3H v_eFe4 qnEc35 hxKTA7 rszMzv">(.*?)</span>',
+    re.IGNORECASE | re.DOTALL,
+)
 
-    def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
 
-    async def scan(self, username: str) -> SocialProfile:
-        import re
-        url = f"{self._base_url}/{username}/"
+class PinterestScanner(StatusProbeScanner):
+    base_url = "https://www.pinterest.com"
+    network_name = "pinterest"
+    url_pattern = "{base_url}/{username}/"
 
-        async with build_async_client(self._settings) as client:
-            response = await client.get(url)
+    def _parse(self, response: httpx.Response, metadata: dict[str, Any]) -> bool:
+        html = response.text
 
-        exists = response.status_code == 200
-        metadata: dict[str, Any] = {
-            "status_code": response.status_code,
-            "final_url": str(response.url),
-        }
-        
-        if response.status_code == 200:
-            # Extraer <title> del HTML
-            html = response.text if hasattr(response, "text") else await response.aread()
-            if not isinstance(html, str):
-                html = html.decode(errors="ignore")
-                
-            #validamos existencia real del perfil con el div que contiene el nombre
-            pattern_exist_div = r'<div class="H2DtUH KwViV7 FE_3R1 KDGhSV Tjcf3c sSBu24" data-test-id="profile-name"><div class="ADXRXN">(.*?)</div>'
-            ne = re.search(pattern_exist_div, html, re.IGNORECASE | re.DOTALL)
-            name= ne.group(1) if ne is not None else None
-            
-            
-            if name is not None:
-                exists = True
-                metadata["name"] = name
-                
-                pattern_desc = r'<span class="WuRgKB aMgNKE YfEt3H v_eFe4 qnEc35 hxKTA7 mm0O_j" data-test-id="main-user-description-text">(.*?)</span>'
-                nd = re.search(pattern_desc, html, re.IGNORECASE | re.DOTALL)
-                if nd is not None:
-                    description = nd.group(1)
-                    metadata["description"] = description 
-                    
-                pattern_avatar = fr'<img alt="{re.escape(name)}" class="iFOUS5" draggable="true" fetchpriority="auto" loading="auto" src="(.*?)"/>'
-                na = re.search(pattern_avatar, html, re.IGNORECASE | re.DOTALL)
-                if na is not None:
-                    avatar_url = na.group(1)
-                    metadata["avatar_url"] = avatar_url
-                                
-                #pattern_website = r'<div class="H2DtUH opw_4g H__hJz Tjcf3c sSBu24" data-test-id="website-icon-and-url"><div class="oRZ5_s"><svg aria-label="(.?)" class="aTSQd5 hL9n03 _ByyDT"'
-                #pattern_website = r'class="etmDmh i7jpet zlD4hU Q3hcOU DodKMr O0u6sV KQwCbH itw4K9 g0I6wi be_g_n ap8aAM" href="(.*?)" rel="noopener noreferrer" tabindex="0" target="_blank">'
-                pattern_website = r'<span class="WuRgKB eMU5i5 YfEt3H v_eFe4 qnEc35 hxKTA7 rszMzv">(.*?)</span>'
-                nw = re.search(pattern_website, html, re.IGNORECASE | re.DOTALL)
+        #validamos existencia real del perfil con el div que contiene el nombre
+        ne = _NAME_RE.search(html)
+        name = ne.group(1) if ne is not None else None
+        if name is None:
+            return False
 
-                if nw is not None:
-                    website_url = nw.group(1)
-                    metadata["other_websites"] = website_url
-        
-            else:
-                exists = False  
-     
+        metadata["name"] = name
 
-        return SocialProfile(
-            url=str(response.url),
-            username=username,
-            network_name="pinterest",
-            existe=exists,
-            metadata=metadata,
-        )
+        nd = _DESC_RE.search(html)
+        if nd is not None:
+            description = nd.group(1)
+            metadata["description"] = description
+
+        for na in _AVATAR_RE.finditer(html):
+            if na.group(1) == name:
+                avatar_url = na.group(2)
+                metadata["avatar_url"] = avatar_url
+                break
+
+        #pattern_website = r'<div class="H2DtUH opw_4g H__hJz Tjcf3c sSBu24" data-test-id="website-icon-and-url"><div class="oRZ5_s"><svg aria-label="(.?)" class="aTSQd5 hL9n03 _ByyDT"'
+        #pattern_website = r'class="etmDmh i7jpet zlD4hU Q3hcOU DodKMr O0u6sV KQwCbH itw4K9 g0I6wi be_g_n ap8aAM" href="(.*?)" rel="noopener noreferrer" tabindex="0" target="_blank">'
+        nw = _WEBSITE_RE.search(html)
+        if nw is not None:
+            website_url = nw.group(1)
+            metadata["other_websites"] = website_url
+        return True
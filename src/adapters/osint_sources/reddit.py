@@ -8,8 +8,11 @@ from __future__ import annotations
 
 from typing import Any
 
+import httpx
+
+from adapters.scan_cache import cached_scan
 from adapters.specific_scrapers import fetch_reddit_deep
-from core.config import AppSettings
+from core.config import AppSettings, get_settings
 from core.domain.models import SocialProfile
 from core.interfaces.scanner import OSINTScanner
 
@@ -17,13 +20,28 @@ from core.interfaces.scanner import OSINTScanner
 class RedditScanner(OSINTScanner):
     _base_url = "https://www.reddit.com"
 
-    def __init__(self, settings: AppSettings | None = None) -> None:
-        self._settings = settings or AppSettings()
+    def __init__(
+        self,
+        settings: AppSettings | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._client = client
+
+    def profile_url(self, username: str) -> str:
+        """URL pública del perfil (la usa también el fallback de errores del pipeline)."""
+
+        return f"{self._base_url}/user/{username}/"
 
+    @cached_scan()
     async def scan(self, username: str) -> SocialProfile:
-        public_url = f"{self._base_url}/user/{username}/"
+        public_url = self.profile_url(username)
 
-        api = await fetch_reddit_deep(username=username, settings=self._settings)
+        api = await fetch_reddit_deep(
+            username=username,
+            settings=self._settings,
+            client=self._client,
+        )
         exists = api is not None
 
         metadata: dict[str, Any] = {
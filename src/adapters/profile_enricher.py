@@ -14,33 +14,49 @@ from __future__ import annotations
 
 import asyncio
 
-from adapters.http_client import build_async_client, extract_html_metadata
+import httpx
+
+from adapters.http_client import client_scope, extract_html_metadata
 from core.config import AppSettings
 from core.domain.models import SocialProfile
 
 
+def _enrichable_url(p: SocialProfile) -> str | None:
+    """URL a descargar para enriquecer `p`, o None si no hace falta."""
+
+    if not p.existe:
+        return None
+    # Si ya tenemos bio o imagen, no insistimos.
+    if p.bio or p.imagen_url:
+        return None
+
+    # Solo HTTP(S), y nunca hosts de relleno (`example.invalid`).
+    url = str(p.url)
+    if not (url.startswith("http://") or url.startswith("https://")):
+        return None
+    if "example.invalid" in url:
+        return None
+    return url
+
+
 async def enrich_profiles_from_html(
     *,
     profiles: list[SocialProfile],
     settings: AppSettings,
     max_concurrency: int = 20,
+    client: httpx.AsyncClient | None = None,
 ) -> None:
-    sem = asyncio.Semaphore(max(1, max_concurrency))
+    # Filtramos antes de crear corutinas o abrir cliente: la mayoría de los
+    # perfiles son `existe=False` o ya traen bio/imagen (p.ej. site-lists).
+    pending = [(p, url) for p in profiles if (url := _enrichable_url(p)) is not None]
+    if not pending:
+        return
 
-    async with build_async_client(settings) as client:
-
-        async def enrich_one(p: SocialProfile) -> None:
-            if not p.existe:
-                return
-            # Si ya tenemos bio o imagen, no insistimos.
-            if p.bio or p.imagen_url:
-                return
+    sem = asyncio.Semaphore(max(1, max_concurrency))
 
-            # Solo HTTP(S)
-            url = str(p.url)
-            if not (url.startswith("http://") or url.startswith("https://")):
-                return
+    async with client_scope(client, settings) as client:
 
+        async def enrich_one(p: SocialProfile, url: str) -> None:
             async with sem:
                 try:
                     resp = await client.get(url)
@@ -53,8 +69,7 @@ async def enrich_profiles_from_html(
                         return
 
                     # Guarda todo en metadata para trazabilidad
-                    if isinstance(p.metadata, dict):
-                        p.metadata = {**p.metadata, **meta}
+                    p.metadata = {**p.metadata, **meta}
 
                     if not p.bio:
                         md = meta.get("meta_description")
@@ -68,4 +83,4 @@ async def enrich_profiles_from_html(
                 except Exception:
                     return
 
-        await asyncio.gather(*(enrich_one(p) for p in profiles))
+        await asyncio.gather(*(enrich_one(p, url) for p, url in pending))
@@ -7,19 +7,31 @@ Por qué está en adapters:
 
 from __future__ import annotations
 
+import re
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from weasyprint import HTML
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from core.domain.language import Language
 from core.domain.models import PersonEntity
 
+# Jinja2 y sobre todo WeasyPrint (cairo/pango, fontconfig) son caros de
+# importar: se cargan en el primer export, no al importar la CLI.
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+    from weasyprint.text.fonts import FontConfiguration
+
 
 _TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
 _TEMPLATES_DIR_FALLBACK = Path(__file__).resolve().parents[1] / "templates"
 
+# `<link ... data-screen-only>`: recursos solo para la vista en navegador. El
+# PDF no los necesita y WeasyPrint tendría que descargarlos y parsearlos.
+_PDF_STRIP_LINKS_RE = re.compile(r"<link\b[^>]*\bdata-screen-only\b[^>]*>", re.IGNORECASE)
+
 _STRINGS: dict[Language, dict[str, object]] = {
     Language.ENGLISH: {
         "lang_code": "en",
@@ -184,43 +196,105 @@ _STRINGS: dict[Language, dict[str, object]] = {
 }
 
 
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Vista inmutable por idioma, con el fallback a inglés ya resuelto: el render
+# hace un único lookup y nadie puede mutar los textos compartidos.
+_STRINGS_FROZEN: dict[Language, Mapping[str, object]] = {
+    lang: _freeze(values) for lang, values in _STRINGS.items()
+}
+_DEFAULT_STRINGS = _STRINGS_FROZEN[Language.ENGLISH]
+
+
+@lru_cache(maxsize=1)
 def _get_env() -> Environment:
+    """Environment único por proceso.
+
+    - `auto_reload=False`: el template no cambia en runtime; evitamos el stat.
+    - `FileSystemBytecodeCache`: los arranques en frío reutilizan el template
+      ya compilado de ejecuciones previas (directorio temporal del usuario).
+    """
+
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
     templates_dir = _TEMPLATES_DIR if _TEMPLATES_DIR.is_dir() else _TEMPLATES_DIR_FALLBACK
     return Environment(
         loader=FileSystemLoader(str(templates_dir)),
         autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
     )
 
 
-def render_person_html(*, person: PersonEntity, language: Language) -> str:
-    """Renderiza un HTML autocontenido para el reporte."""
+@lru_cache(maxsize=1)
+def _get_template() -> Template:
+    return _get_env().get_template("report.html")
+
 
-    generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
-    generated_at_local = datetime.now().astimezone().isoformat(timespec="seconds")
+# Estado de WeasyPrint compartido entre exports del mismo proceso:
+# - `FontConfiguration`: el descubrimiento de fuentes (fontconfig) se hace una vez.
+# - `_PDF_CACHE`: imágenes/SVG ya descargados y parseados; el dict sobrevive
+#   entre renders, así que el logo/fondos del template solo se procesan una vez.
+_PDF_CACHE: dict[str, Any] = {}
 
-    profiles_total = len(person.profiles)
-    profiles_confirmed = [p for p in person.profiles if p.existe]
-    profiles_unconfirmed = [p for p in person.profiles if not p.existe]
 
-    def _source_for_profile(profile) -> str:
-        md = getattr(profile, "metadata", None)
-        if isinstance(md, dict):
-            value = md.get("source")
-            if value:
-                return str(value)
-        return "unknown"
+@lru_cache(maxsize=1)
+def _font_config() -> FontConfiguration:
+    from weasyprint.text.fonts import FontConfiguration
 
-    for p in person.profiles:
-        try:
-            setattr(p, "_source", _source_for_profile(p))
-        except Exception:
-            # Best-effort: si el modelo es inmutable, omitimos el campo.
-            pass
+    return FontConfiguration()
 
+
+def warm_up_pdf_export() -> None:
+    """Precarga WeasyPrint, las fuentes y el template (best-effort).
+
+    Pensado para ejecutarse en un thread mientras la CLI espera otra cosa
+    (p.ej. la respuesta de la IA): el PDF necesita el análisis, pero este
+    coste fijo no. Los errores se ignoran; el export real los reporta.
+    """
+
+    try:
+        _get_template()
+        _font_config()
+    except Exception:
+        pass
+
+
+def render_person_html(*, person: PersonEntity, language: Language) -> str:
+    """Renderiza un HTML autocontenido para el reporte."""
+
+    # Una sola lectura del reloj: UTC y hora local representan el mismo instante.
+    now_utc = datetime.now(timezone.utc)
+    generated_at = now_utc.isoformat(timespec="seconds")
+    generated_at_local = now_utc.astimezone().isoformat(timespec="seconds")
+
+    profiles = person.profiles
+    profiles_total = len(profiles)
+    profiles_confirmed: list = []
     unconfirmed_by_source_map: dict[str, list] = {}
-    for p in profiles_unconfirmed:
-        source = _source_for_profile(p)
-        unconfirmed_by_source_map.setdefault(source, []).append(p)
+    profiles_unconfirmed_count = 0
+
+    # Fuente por perfil (por identidad): el template la consulta con
+    # `profile_source(p)` sin que tengamos que mutar los modelos del llamador.
+    source_by_id: dict[int, str] = {}
+
+    # Una sola pasada: fuente, partición confirmados/pendientes y agrupado.
+    confirmed_append = profiles_confirmed.append
+    for p in profiles:
+        md = p.metadata
+        source = str(md["source"]) if isinstance(md, dict) and md.get("source") else "unknown"
+        source_by_id[id(p)] = source
+        if p.existe:
+            confirmed_append(p)
+        else:
+            profiles_unconfirmed_count += 1
+            unconfirmed_by_source_map.setdefault(source, []).append(p)
 
     unconfirmed_by_source = sorted(
         unconfirmed_by_source_map.items(),
@@ -228,8 +302,8 @@ def render_person_html(*, person: PersonEntity, language: Language) -> str:
     )
 
     report_id = f"{person.target}:{generated_at}"
-    template = _get_env().get_template("report.html")
-    strings = _STRINGS.get(language, _STRINGS[Language.ENGLISH])
+    template = _get_template()
+    strings = _STRINGS_FROZEN.get(language, _DEFAULT_STRINGS)
     return template.render(
         person=person,
         generated_at=generated_at,
@@ -238,8 +312,9 @@ def render_person_html(*, person: PersonEntity, language: Language) -> str:
         profiles_total=profiles_total,
         profiles_confirmed=profiles_confirmed,
         profiles_confirmed_count=len(profiles_confirmed),
-        profiles_unconfirmed_count=len(profiles_unconfirmed),
+        profiles_unconfirmed_count=profiles_unconfirmed_count,
         unconfirmed_by_source=unconfirmed_by_source,
+        profile_source=lambda p: source_by_id.get(id(p), "unknown"),
         strings=strings,
     )
 
@@ -254,7 +329,8 @@ def export_person_html(*, person: PersonEntity, output_path: Path, language: Lan
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     html = render_person_html(person=person, language=language)
-    output_path.write_text(html, encoding="utf-8")
+    # Un único `write` binario del documento ya renderizado, sin la capa de texto.
+    output_path.write_bytes(html.encode("utf-8"))
     return output_path
 
 
@@ -266,8 +342,16 @@ def export_person_pdf(*, person: PersonEntity, output_path: Path, language: Lang
       thread si fuese necesario más adelante.
     """
 
+    from weasyprint import HTML
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
     html = render_person_html(person=person, language=language)
+    # El export HTML conserva los estilos de pantalla; el PDF no los necesita.
+    html = _PDF_STRIP_LINKS_RE.sub("", html)
     base_url = str(_TEMPLATES_DIR if _TEMPLATES_DIR.is_dir() else _TEMPLATES_DIR_FALLBACK)
-    HTML(string=html, base_url=base_url).write_pdf(str(output_path))
+    HTML(string=html, base_url=base_url).write_pdf(
+        str(output_path),
+        font_config=_font_config(),
+        cache=_PDF_CACHE,
+    )
     return output_path
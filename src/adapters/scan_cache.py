@@ -0,0 +1,116 @@
+"""Memoización de scans (TTL + LRU).
+
+Por qué:
+- Re-escanear el mismo username (dashboards, batch, pivotes que convergen en
+  el mismo alias) repetía todas las peticiones HTTP.
+- Guardamos la *Task* en vuelo y no solo el resultado: llamadas concurrentes
+  para la misma clave se agrupan en una única petición.
+
+- Solo se guardan respuestas definitivas: un 429 o un 5xx se ve como
+  `existe=False`, pero no dice nada del perfil; cachearlo daría el perfil por
+  inexistente durante todo el TTL.
+
+Nota:
+- El event loop es monohilo y entre el lookup y la inserción no hay `await`,
+  así que no hace falta un lock por clave.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from core.domain.models import SocialProfile
+
+ScanResult = SocialProfile | list[SocialProfile]
+ScanMethod = Callable[[Any, str], Awaitable[ScanResult]]
+
+
+def _failed(task: asyncio.Future[ScanResult]) -> bool:
+    return task.done() and (task.cancelled() or task.exception() is not None)
+
+
+# Status que no responden a "¿existe el perfil?": timeout, rate limit.
+_TRANSIENT_STATUS = frozenset({408, 429})
+
+
+def _is_definitive(result: ScanResult) -> bool:
+    """Indica si el resultado puede reutilizarse durante el TTL.
+
+    Cuenta el perfil principal (el primero si hay varios): un positivo siempre
+    es definitivo; un negativo solo si trae un status HTTP que lo respalde
+    (no 408/429 ni 5xx). Los negativos sin status (p.ej. APIs que devuelven
+    None ante cualquier error) no se cachean.
+    """
+
+    profile = result[0] if isinstance(result, list) else result
+    if profile.existe:
+        return True
+    status = profile.metadata.get("status_code")
+    return isinstance(status, int) and status < 500 and status not in _TRANSIENT_STATUS
+
+
+def _copy_result(result: ScanResult) -> ScanResult:
+    # Cada llamador recibe su copia: el pipeline muta metadata/bio después.
+    if isinstance(result, list):
+        return [p.model_copy(deep=True) for p in result]
+    return result.model_copy(deep=True)
+
+
+def cached_scan(*, ttl: float = 300.0, maxsize: int = 10_000) -> Callable[[ScanMethod], ScanMethod]:
+    """Decora `scan(self, username)` con una caché TTL + LRU.
+
+    La clave es `(clase del scanner, username)`: un mismo `scan` heredado
+    (p.ej. `StatusProbeScanner.scan`) no mezcla resultados entre fuentes.
+
+    - `ttl`: segundos durante los que un resultado se considera válido.
+    - `maxsize`: entradas máximas; se descarta la usada hace más tiempo.
+    - Los errores y las respuestas no definitivas (ver `_is_definitive`) no
+      se cachean: los llamadores concurrentes comparten la petición, pero el
+      siguiente intento vuelve a la red.
+    """
+
+    def decorator(scan: ScanMethod) -> ScanMethod:
+        entries: OrderedDict[tuple[type, str], tuple[float, asyncio.Future[ScanResult]]] = OrderedDict()
+
+        @functools.wraps(scan)
+        async def wrapper(self: Any, username: str) -> ScanResult:
+            key = (type(self), username)
+            now = time.monotonic()
+            entry = entries.get(key)
+            if entry is not None and entry[0] > now and not _failed(entry[1]):
+                entries.move_to_end(key)
+                task = entry[1]
+            else:
+                task = asyncio.ensure_future(scan(self, username))
+                entries[key] = (now + ttl, task)
+                entries.move_to_end(key)
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+
+            def evict() -> None:
+                current = entries.get(key)
+                if current is not None and current[1] is task:
+                    del entries[key]
+
+            try:
+                # shield: cancelar a un llamador no cancela la Task compartida.
+                result = await asyncio.shield(task)
+            except BaseException:
+                # Si solo se canceló este llamador, la Task sigue en vuelo para
+                # los demás: se queda en la caché.
+                if _failed(task):
+                    evict()
+                raise
+            if not _is_definitive(result):
+                evict()
+            return _copy_result(result)
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
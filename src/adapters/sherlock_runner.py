@@ -14,25 +14,21 @@ Nota: el manifest real tiene muchos detalles; este es un MVP conservador.
 from __future__ import annotations
 
 import asyncio
+import logging
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from enum import IntFlag
 from typing import Any
-from collections.abc import Callable
 
-from adapters.http_client import build_async_client, extract_html_metadata
+import httpx
+
+from adapters.http_client import cached_html_metadata, client_scope
+from adapters.site_lists.slug import slug
 from core.config import AppSettings
 from core.domain.models import SocialProfile
 
-
-def _slug(name: str) -> str:
-    out = []
-    for ch in name.strip().lower():
-        if ch.isalnum():
-            out.append(ch)
-        elif ch in ("-", "_"):
-            out.append(ch)
-        else:
-            out.append("-")
-    s = "".join(out).strip("-")
-    return (s[:60] or "site")
+logger = logging.getLogger(__name__)
 
 
 def _is_nsfw(info: dict[str, Any]) -> bool:
@@ -40,22 +36,153 @@ def _is_nsfw(info: dict[str, Any]) -> bool:
     return bool(v)
 
 
-def _interpolate(url_template: str, username: str) -> str:
+def filter_sherlock_sites(manifest: dict[str, Any], *, no_nsfw: bool) -> list[tuple[str, dict[str, Any]]]:
+    """Sitios del manifest a comprobar: sin `$schema`, entradas no-dict ni NSFW (si aplica)."""
+
+    # Manifest es dict: site_name -> info
+    return [
+        (site_name, info)
+        for site_name, info in manifest.items()
+        if site_name != "$schema"
+        and isinstance(info, dict)
+        and not (no_nsfw and _is_nsfw(info))
+    ]
+
+
+class ErrKind(IntFlag):
+    """`errorType` del manifest como máscara de bits (un `&` por check)."""
+
+    NONE = 0
+    RESPONSE_URL = 1
+    STATUS_CODE = 2
+    MESSAGE = 4
+
+
+_ERR_KINDS: dict[str, ErrKind] = {
+    "response_url": ErrKind.RESPONSE_URL,
+    "status_code": ErrKind.STATUS_CODE,
+    "message": ErrKind.MESSAGE,
+}
+
+
+@dataclass(slots=True)
+class _SiteSpec:
+    """Entrada del manifest ya normalizada (se calcula una vez por sitio).
+
+    Por qué:
+    - El manifest es JSON libre; validar/coaccionar tipos dentro de `check()`
+      repetía el mismo trabajo para cada username.
+    """
+
+    name: str
+    network_name: str
+    # Estrategia de interpolación elegida una vez (ver `_url_builder`);
+    # None si el sitio no tiene `url` usable.
+    url_build: Callable[[str], str] | None
+    # `error_type_names` conserva el orden del manifest (se expone en metadata);
+    # `kinds` es lo que consulta `check()`.
+    error_type_names: tuple[str, ...]
+    kinds: ErrKind
+    request_method: str
+    # HEAD puesto por nosotros (sitios solo `status_code`), no por el manifest:
+    # si el servidor no lo soporta se vuelve a GET para el resto de usernames.
+    speculative_head: bool
+    headers: dict[str, Any] | None
+    error_codes: frozenset[int] | None
+    # Un solo needle: `in` (búsqueda de subcadena en C). Varios: una
+    # alternancia compilada, una pasada sobre el body en vez de N.
+    error_msg: str | None
+    error_msg_re: re.Pattern[str] | None
+    url_main: Any
+
+
+def _url_builder(url_template: str) -> Callable[[str], str]:
+    """Devuelve `username -> url` para la plantilla del sitio.
+
+    - `{}`: `str.replace` (el caso habitual en el manifest).
+    - Sin llaves: la URL no depende del username.
+    - Resto: `str.format`, devolviendo la plantilla tal cual si falla.
+    """
+
     if "{}" in url_template:
-        return url_template.replace("{}", username)
-    try:
-        return url_template.format(username)
-    except Exception:
-        return url_template
-
-
-def _contains_any(text: str, needle: Any) -> bool:
-    if not needle:
-        return False
-    if isinstance(needle, str):
-        return needle in text
-    if isinstance(needle, list):
-        return any(isinstance(n, str) and n in text for n in needle)
+        return lambda username: url_template.replace("{}", username)
+    if "{" not in url_template and "}" not in url_template:
+        return lambda username: url_template
+
+    def build(username: str) -> str:
+        try:
+            return url_template.format(username)
+        except Exception:
+            return url_template
+
+    return build
+
+
+def _site_spec(site_name: str, info: dict[str, Any]) -> _SiteSpec:
+    url_t = info.get("url")
+
+    error_type = info.get("errorType")
+    if isinstance(error_type, str):
+        error_type_names: tuple[str, ...] = (error_type,)
+    elif isinstance(error_type, list):
+        error_type_names = tuple(t for t in error_type if isinstance(t, str))
+    else:
+        error_type_names = ()
+    kinds = ErrKind.NONE
+    for t in error_type_names:
+        kinds |= _ERR_KINDS.get(t, ErrKind.NONE)
+
+    error_codes = info.get("errorCode")
+    if isinstance(error_codes, int):
+        error_codes = [error_codes]
+    if isinstance(error_codes, list):
+        codes: frozenset[int] | None = frozenset(c for c in error_codes if isinstance(c, int))
+    else:
+        codes = None
+
+    error_msg: str | None = None
+    error_msg_re: re.Pattern[str] | None = None
+    msg = info.get("errorMsg")
+    if isinstance(msg, str) and msg:
+        error_msg = msg
+    elif isinstance(msg, list) and msg:
+        needles = [n for n in msg if isinstance(n, str)]
+        if needles:
+            # Más cortos primero: antes se descarta/confirma en cada posición.
+            error_msg_re = re.compile("|".join(map(re.escape, sorted(needles, key=len))))
+
+    headers = info.get("headers")
+    request_method = info.get("request_method")
+    if not isinstance(request_method, str):
+        request_method = "GET"
+    request_method = request_method.upper()
+
+    # Solo el status decide: no hace falta descargar ni decodificar el body.
+    speculative_head = kinds == ErrKind.STATUS_CODE and request_method == "GET"
+    if speculative_head:
+        request_method = "HEAD"
+
+    return _SiteSpec(
+        name=site_name,
+        network_name=slug(site_name),
+        url_build=_url_builder(url_t) if isinstance(url_t, str) and url_t else None,
+        error_type_names=error_type_names,
+        kinds=kinds,
+        request_method=request_method,
+        speculative_head=speculative_head,
+        headers=headers if isinstance(headers, dict) else None,
+        error_codes=codes,
+        error_msg=error_msg,
+        error_msg_re=error_msg_re,
+        url_main=info.get("urlMain"),
+    )
+
+
+def _error_msg_found(spec: _SiteSpec, text: str) -> bool:
+    if spec.error_msg is not None:
+        return spec.error_msg in text
+    if spec.error_msg_re is not None:
+        return spec.error_msg_re.search(text) is not None
     return False
 
 
@@ -67,137 +194,141 @@ async def run_sherlock_username(
     max_concurrency: int,
     no_nsfw: bool,
     progress_callback: Callable[[int, int, str], None] | None = None,
+    client: httpx.AsyncClient | None = None,
+    sites: Sequence[tuple[str, dict[str, Any]]] | None = None,
 ) -> list[SocialProfile]:
-    sem = asyncio.Semaphore(max(1, max_concurrency))
+    """Comprueba `usernames` contra los sitios del manifest.
 
-    # Manifest es dict: site_name -> info
-    items: list[tuple[str, dict[str, Any]]] = []
-
-    for site_name, info in manifest.items():
-        if site_name == "$schema":
-            continue
-        if not isinstance(info, dict):
-            continue
-        if no_nsfw and _is_nsfw(info):
-            continue
-        items.append((site_name, info))
+    `sites`: resultado de `filter_sherlock_sites` si el llamador ya lo tiene
+    (p.ej. para calcular el total del progreso); evita filtrar dos veces.
+    """
+
+    workers = max(1, max_concurrency)
+
+    if sites is None:
+        sites = filter_sherlock_sites(manifest, no_nsfw=no_nsfw)
+    items = [_site_spec(site_name, info) for site_name, info in sites]
     total = len(items) * max(1, len(usernames))
     if progress_callback:
         # Primer tick: permite inicializar la UI.
         progress_callback(0, total, "")
 
-    async with build_async_client(settings) as client:
+    async with client_scope(client, settings) as client:
 
-        async def check(site_name: str, info: dict[str, Any], username: str) -> SocialProfile | None:
-            url_t = info.get("url")
-            if not isinstance(url_t, str) or not url_t:
+        async def check(spec: _SiteSpec, username: str) -> SocialProfile | None:
+            if spec.url_build is None:
                 return None
 
-            url = _interpolate(url_t, username)
-            error_type = info.get("errorType")
-            if isinstance(error_type, str):
-                error_types = [error_type]
-            elif isinstance(error_type, list):
-                error_types = [t for t in error_type if isinstance(t, str)]
-            else:
-                error_types = []
-
-            headers = info.get("headers") if isinstance(info.get("headers"), dict) else None
-            request_method = info.get("request_method")
-            if not isinstance(request_method, str):
-                request_method = "GET"
-            request_method = request_method.upper()
-
-            async with sem:
-                try:
-                    if request_method == "HEAD":
-                        resp = await client.head(url, headers=headers)
-                        text = ""
-                    else:
+            url = spec.url_build(username)
+            kinds = spec.kinds
+            headers = spec.headers
+            request_method = spec.request_method
+
+            try:
+                if request_method == "HEAD":
+                    resp = await client.head(url, headers=headers)
+                    text = ""
+                    if spec.speculative_head and resp.status_code in (405, 501):
+                        spec.request_method = "GET"
                         resp = await client.get(url, headers=headers)
                         text = resp.text or ""
+                else:
+                    resp = await client.get(url, headers=headers)
+                    text = resp.text or ""
+
+                status = resp.status_code
+                final_url = str(resp.url)
 
-                    status = resp.status_code
-                    final_url = str(resp.url)
-
-                    exists = None
-
-                    if "response_url" in error_types:
-                        exists = 200 <= status < 300
-
-                    if "status_code" in error_types and exists is None:
-                        error_codes = info.get("errorCode")
-                        if isinstance(error_codes, int):
-                            error_codes = [error_codes]
-                        if isinstance(error_codes, list):
-                            error_codes = [c for c in error_codes if isinstance(c, int)]
-                        else:
-                            error_codes = None
-
-                        if status < 200 or status >= 300:
-                            exists = False
-                        elif error_codes and status in error_codes:
-                            exists = False
-                        else:
-                            exists = True
-
-                    if "message" in error_types and exists is None:
-                        error_msg = info.get("errorMsg")
-                        # Si el errorMsg aparece, entonces NO existe.
-                        exists = not _contains_any(text, error_msg)
-
-                    if exists is None:
-                        # Fallback conservador
-                        exists = 200 <= status < 300
-
-                    if not exists:
-                        return None
-
-                    html_meta = extract_html_metadata(html=text, base_url=final_url)
-                    print(f"[debug] Sherlock: encontrado en {site_name} para {username}")
-                    metadata: dict[str, Any] = {
-                        "source": "sherlock",
-                        "site_name": site_name,
-                        "url_main": info.get("urlMain"),
-                        "errorType": error_types,
-                        "status_code": status,
-                        "final_url": final_url,
-                        **html_meta,
-                    }
-
-                    return SocialProfile(
-                        url=final_url,
-                        username=username,
-                        network_name=_slug(site_name),
-                        existe=True,
-                        metadata=metadata,
-                        bio=html_meta.get("meta_description"),
-                        imagen_url=html_meta.get("og_image"),
-                    )
-                except Exception:
+                exists = None
+
+                if kinds & ErrKind.RESPONSE_URL:
+                    exists = 200 <= status < 300
+
+                if kinds & ErrKind.STATUS_CODE and exists is None:
+                    error_codes = spec.error_codes
+                    if status < 200 or status >= 300:
+                        exists = False
+                    elif error_codes and status in error_codes:
+                        exists = False
+                    else:
+                        exists = True
+
+                if kinds & ErrKind.MESSAGE and exists is None:
+                    # Si el errorMsg aparece, entonces NO existe.
+                    exists = not _error_msg_found(spec, text)
+
+                if exists is None:
+                    # Fallback conservador
+                    exists = 200 <= status < 300
+
+                if not exists:
                     return None
 
-        tasks: list[asyncio.Future[SocialProfile | None]] = []
-        task_labels: dict[asyncio.Future[SocialProfile | None], str] = {}
-        for name, info in items:
-            for username in usernames:
-                label = f"sherlock:{name}:{username}"
-                t = asyncio.create_task(check(name, info, username), name=label)
-                tasks.append(t)
-                task_labels[t] = label
+                if spec.speculative_head and resp.request.method == "HEAD":
+                    # Hallazgo vía HEAD: el body solo hace falta para la
+                    # metadata, y solo en los (pocos) hits.
+                    try:
+                        text = (await client.get(final_url, headers=headers)).text or ""
+                    except httpx.HTTPError:
+                        text = ""
 
+                html_meta = cached_html_metadata(html=text, base_url=final_url)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Sherlock hit: %s %s", spec.name, username)
+                metadata: dict[str, Any] = {
+                    "source": "sherlock",
+                    "site_name": spec.name,
+                    "url_main": spec.url_main,
+                    "errorType": list(spec.error_type_names),
+                    "status_code": status,
+                    "final_url": final_url,
+                    **html_meta,
+                }
+
+                return SocialProfile(
+                    url=final_url,
+                    username=username,
+                    network_name=spec.network_name,
+                    existe=True,
+                    metadata=metadata,
+                    bio=html_meta.get("meta_description"),
+                    imagen_url=html_meta.get("og_image"),
+                )
+            except Exception:
+                return None
+
+        # Cola acotada + `workers` consumidores: como mucho `workers` checks
+        # vivos a la vez, en vez de una Task por (sitio, username) desde el
+        # principio.
+        queue: asyncio.Queue[tuple[_SiteSpec, str] | None] = asyncio.Queue(maxsize=2 * workers)
         completed = 0
         found: list[SocialProfile] = []
-        for t in asyncio.as_completed(tasks):
-            r = await t
-            completed += 1
-            if progress_callback:
-                try:
-                    progress_callback(completed, total, task_labels.get(t, ""))
-                except Exception:
-                    # Nunca dejar que la UI rompa el scanning.
-                    pass
-            if r is not None:
-                found.append(r)
+
+        async def produce() -> None:
+            for spec in items:
+                for username in usernames:
+                    await queue.put((spec, username))
+            for _ in range(workers):
+                await queue.put(None)
+
+        async def work() -> None:
+            nonlocal completed
+            while (job := await queue.get()) is not None:
+                spec, username = job
+                r = await check(spec, username)
+                completed += 1
+                if progress_callback:
+                    try:
+                        progress_callback(completed, total, f"sherlock:{spec.name}:{username}")
+                    except Exception:
+                        # Nunca dejar que la UI rompa el scanning.
+                        pass
+                if r is not None:
+                    found.append(r)
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            for _ in range(workers):
+                tg.create_task(work())
 
     return found
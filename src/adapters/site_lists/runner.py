@@ -2,6 +2,8 @@
 
 Diseño:
 - Ejecuta checks concurrentes con un semáforo.
+- Las coroutines se crean bajo demanda (`_bounded_map`): con miles de sitios no
+  materializamos miles de Tasks ni retenemos todos los bodies a la vez.
 - Devuelve solo hallazgos (FOUND) como `SocialProfile` para evitar inflar el output.
 
 Limitaciones (MVP):
@@ -12,27 +14,23 @@ Limitaciones (MVP):
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import itertools
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, TypeVar
 
-from adapters.http_client import build_async_client
-from adapters.http_client import extract_html_metadata
+import httpx
+
+from adapters.http_client import cached_html_metadata, client_scope
 from adapters.site_lists.models import EmailSite, UsernameSite
 from adapters.site_lists.operations import apply_input_operation
+from adapters.site_lists.slug import slug
 from core.config import AppSettings
 from core.domain.models import SocialProfile
 
+logger = logging.getLogger(__name__)
 
-def _slug(name: str) -> str:
-    out = []
-    for ch in name.strip().lower():
-        if ch.isalnum():
-            out.append(ch)
-        elif ch in ("-", "_"):
-            out.append(ch)
-        else:
-            out.append("-")
-    s = "".join(out).strip("-")
-    return (s[:60] or "site")
+_T = TypeVar("_T")
 
 
 def _is_nsfw(category: str | None) -> bool:
@@ -41,16 +39,54 @@ def _is_nsfw(category: str | None) -> bool:
     return "nsfw" in category.lower()
 
 
-def _match_found(*, text: str, status_code: int, e_code: int, e_string: str, m_code: int | None, m_string: str | None) -> bool:
-    if status_code != e_code:
-        return False
-    if e_string not in text:
-        return False
-    if m_code is not None and status_code == m_code:
-        return False
-    if m_string and m_string in text:
-        return False
-    return True
+async def _bounded_map(coros: Iterable[Awaitable[_T]], limit: int) -> AsyncIterator[tuple[int, _T]]:
+    """Ejecuta `coros` con como mucho `limit` Tasks vivas.
+
+    Rinde `(índice, resultado)` según terminan; el índice permite al llamador
+    recuperar el orden original si lo necesita.
+    """
+
+    it = enumerate(coros)
+    pending: dict[asyncio.Future[_T], int] = {}
+
+    def _fill(n: int) -> None:
+        for idx, coro in itertools.islice(it, n):
+            pending[asyncio.ensure_future(coro)] = idx
+
+    _fill(max(1, limit))
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield pending.pop(task), task.result()
+            _fill(len(done))
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+Matcher = Callable[[str, int], bool]
+
+
+def _build_matcher(site: UsernameSite | EmailSite) -> Matcher:
+    """Especializa la heurística FOUND para un sitio concreto.
+
+    Las decisiones que solo dependen del sitio (¿hay `m_code`? ¿hay
+    `m_string`?) se toman una vez aquí y no en cada (sitio, cuenta).
+    """
+
+    e_code = site.e_code
+    e_string = site.e_string
+    m_string = site.m_string
+
+    if site.m_code is not None and site.m_code == e_code:
+        # El código de "encontrado" coincide con el de "no encontrado".
+        return lambda text, status_code: False
+    if m_string:
+        return lambda text, status_code: (
+            status_code == e_code and e_string in text and m_string not in text
+        )
+    return lambda text, status_code: status_code == e_code and e_string in text
 
 
 async def run_username_sites(
@@ -59,8 +95,9 @@ async def run_username_sites(
     sites: list[UsernameSite],
     settings: AppSettings,
     max_concurrency: int,
-    categories: set[str] | None,
+    categories: frozenset[str] | None,
     no_nsfw: bool,
+    client: httpx.AsyncClient | None = None,
 ) -> list[SocialProfile]:
     semaphore = asyncio.Semaphore(max(1, max_concurrency))
 
@@ -72,42 +109,39 @@ async def run_username_sites(
             continue
         filtered.append(s)
 
-    async with build_async_client(settings) as client:
+    async with client_scope(client, settings) as client:
 
-        async def check(site: UsernameSite, username: str) -> SocialProfile | None:
+        async def check(site: UsernameSite, matcher: Matcher, network_name: str, username: str) -> SocialProfile | None:
             url = site.uri_check.replace("{account}", username)
             async with semaphore:
                 try:
                     resp = await client.get(url)
+                    # Status primero: evitamos decodificar el body de los descartes.
+                    if resp.status_code != site.e_code:
+                        return None
                     text = resp.text or ""
-                   
-                    found = _match_found(
-                        text=text,
-                        status_code=resp.status_code,
-                        e_code=site.e_code,
-                        e_string=site.e_string,
-                        m_code=site.m_code,
-                        m_string=site.m_string,
-                    )
-                    if not found:
+
+                    if not matcher(text, resp.status_code):
                         return None
 
-                    html_meta = extract_html_metadata(html=text, base_url=str(resp.url))
+                    final_url = str(resp.url)
+                    html_meta = cached_html_metadata(html=text, base_url=final_url)
 
                     metadata: dict[str, Any] = {
                         "status_code": resp.status_code,
-                        "final_url": str(resp.url),
+                        "final_url": final_url,
                         "category": site.cat,
                         "source": "site_list",
                         "site_name": site.name,
                         **html_meta,
                     }
-                    print(f"[debug] Sherlock: metadata: {metadata}")
-                    
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("site-list hit: %s metadata=%s", site.name, metadata)
+
                     return SocialProfile(
-                        url=str(resp.url),
+                        url=final_url,
                         username=username,
-                        network_name=_slug(site.name),
+                        network_name=network_name,
                         existe=True,
                         metadata=metadata,
                         bio=html_meta.get("meta_description"),
@@ -117,9 +151,17 @@ async def run_username_sites(
                     # Errores: para masivo preferimos no contaminar con cientos de errores.
                     return None
 
-        results = await asyncio.gather(*(check(s, username) for s in filtered for username in usernames), return_exceptions=False)
+        found: list[tuple[int, SocialProfile]] = []
+        # Matcher y slug se calculan una vez por sitio, no por username.
+        per_site = [(s, _build_matcher(s), slug(s.name)) for s in filtered]
+        jobs = (check(s, m, n, username) for s, m, n in per_site for username in usernames)
+        async for idx, r in _bounded_map(jobs, 2 * max(1, max_concurrency)):
+            if r is not None:
+                found.append((idx, r))
 
-    return [r for r in results if r is not None]
+    # Mismo orden que el dataset (como con `gather`), no el de llegada.
+    found.sort(key=lambda item: item[0])
+    return [r for _, r in found]
 
 
 async def run_email_sites(
@@ -128,8 +170,9 @@ async def run_email_sites(
     sites: list[EmailSite],
     settings: AppSettings,
     max_concurrency: int,
-    categories: set[str] | None,
+    categories: frozenset[str] | None,
     no_nsfw: bool,
+    client: httpx.AsyncClient | None = None,
 ) -> list[SocialProfile]:
     semaphore = asyncio.Semaphore(max(1, max_concurrency))
 
@@ -141,9 +184,9 @@ async def run_email_sites(
             continue
         filtered.append(s)
 
-    async with build_async_client(settings) as client:
+    async with client_scope(client, settings) as client:
 
-        async def check(site: EmailSite, email: str) -> SocialProfile | None:
+        async def check(site: EmailSite, matcher: Matcher, network_name: str, email: str) -> SocialProfile | None:
             processed = apply_input_operation(email, site.input_operation)
             url = site.uri_check.replace("{account}", processed)
             data = site.data.replace("{account}", processed) if site.data else None
@@ -157,23 +200,19 @@ async def run_email_sites(
                     else:
                         resp = await client.get(url, headers=headers)
 
+                    # Status primero: evitamos decodificar el body de los descartes.
+                    if resp.status_code != site.e_code:
+                        return None
                     text = resp.text or ""
-                    found = _match_found(
-                        text=text,
-                        status_code=resp.status_code,
-                        e_code=site.e_code,
-                        e_string=site.e_string,
-                        m_code=site.m_code,
-                        m_string=site.m_string,
-                    )
-                    if not found:
+                    if not matcher(text, resp.status_code):
                         return None
 
-                    html_meta = extract_html_metadata(html=text, base_url=str(resp.url))
+                    final_url = str(resp.url)
+                    html_meta = cached_html_metadata(html=text, base_url=final_url)
 
                     metadata: dict[str, Any] = {
                         "status_code": resp.status_code,
-                        "final_url": str(resp.url),
+                        "final_url": final_url,
                         "category": site.cat,
                         "source": "email_site_list",
                         "site_name": site.name,
@@ -182,9 +221,9 @@ async def run_email_sites(
                     }
 
                     return SocialProfile(
-                        url=str(resp.url),
+                        url=final_url,
                         username=email,
-                        network_name=_slug(site.name),
+                        network_name=network_name,
                         existe=True,
                         metadata=metadata,
                         bio=html_meta.get("meta_description"),
@@ -193,6 +232,13 @@ async def run_email_sites(
                 except Exception:
                     return None
 
-        results = await asyncio.gather(*(check(s, email) for s in filtered for email in emails), return_exceptions=False)
+        found: list[tuple[int, SocialProfile]] = []
+        per_site = [(s, _build_matcher(s), slug(s.name)) for s in filtered]
+        jobs = (check(s, m, n, email) for s, m, n in per_site for email in emails)
+        async for idx, r in _bounded_map(jobs, 2 * max(1, max_concurrency)):
+            if r is not None:
+                found.append((idx, r))
 
-    return [r for r in results if r is not None]
+    # Mismo orden que el dataset (como con `gather`), no el de llegada.
+    found.sort(key=lambda item: item[0])
+    return [r for _, r in found]
@@ -0,0 +1,23 @@
+"""Slug de nombres de sitio (para `network_name`).
+
+Por qué un módulo propio:
+- Lo comparten el runner de site-lists y el de Sherlock; una sola definición
+  garantiza que el mismo sitio produce el mismo `network_name` en ambos.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+
+# `\w` en `str` Unicode equivale a `isalnum()` + `_`: todo lo demás (salvo `-`)
+# se sustituye carácter a carácter por `-`, en una sola pasada en C.
+_SLUG_RE = re.compile(r"[^\w-]")
+
+
+def slug(name: str) -> str:
+    s = _SLUG_RE.sub("-", name.strip().lower()).strip("-")
+    # Internado: todos los perfiles de un sitio (y de ambos runners) comparten
+    # el mismo objeto, y las comparaciones/lookups por `network_name` aciertan
+    # por identidad.
+    return sys.intern(s[:60] or "site")
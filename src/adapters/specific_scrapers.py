@@ -12,20 +12,27 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
-from adapters.http_client import build_async_client
-from core.config import AppSettings
+import httpx
 
+from adapters.http_client import client_scope
+from core.config import AppSettings, get_settings
 
-async def fetch_github_user(*, username: str, settings: AppSettings | None = None) -> dict[str, Any] | None:
-    settings = settings or AppSettings()
+
+async def fetch_github_user(
+    *,
+    username: str,
+    settings: AppSettings | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> dict[str, Any] | None:
+    settings = settings or get_settings()
     url = f"https://api.github.com/users/{username}"
     headers = {
         # GitHub requiere UA. Accept JSON versión estable.
         "Accept": "application/vnd.github+json",
     }
 
-    async with build_async_client(settings, extra_headers=headers) as client:
-        resp = await client.get(url)
+    async with client_scope(client, settings) as c:
+        resp = await c.get(url, headers=headers)
 
     if resp.status_code == 404:
         return None
@@ -59,6 +66,7 @@ async def fetch_github_recent_events(
     username: str,
     limit: int = 10,
     settings: AppSettings | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> list[dict[str, Any]]:
     """Extrae eventos públicos recientes (útil para commits en PushEvent).
 
@@ -67,13 +75,13 @@ async def fetch_github_recent_events(
     - No inferimos atributos sensibles; solo capturamos evidencia textual/temporal.
     """
 
-    settings = settings or AppSettings()
+    settings = settings or get_settings()
     url = f"https://api.github.com/users/{username}/events/public"
     headers = {"Accept": "application/vnd.github+json"}
 
     try:
-        async with build_async_client(settings, extra_headers=headers) as client:
-            resp = await client.get(url)
+        async with client_scope(client, settings) as c:
+            resp = await c.get(url, headers=headers)
         if resp.status_code != 200:
             return []
         data = resp.json()
@@ -94,15 +102,21 @@ async def fetch_github_deep(
     username: str,
     limit_events: int = 10,
     settings: AppSettings | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any] | None:
     """Combina perfil base + actividad reciente (mensajes de commits si hay PushEvent)."""
 
-    settings = settings or AppSettings()
-    base = await fetch_github_user(username=username, settings=settings)
+    settings = settings or get_settings()
+    base = await fetch_github_user(username=username, settings=settings, client=client)
     if base is None:
         return None
 
-    events = await fetch_github_recent_events(username=username, limit=limit_events, settings=settings)
+    events = await fetch_github_recent_events(
+        username=username,
+        limit=limit_events,
+        settings=settings,
+        client=client,
+    )
     commits: list[dict[str, Any]] = []
     for ev in events:
         if ev.get("type") != "PushEvent":
@@ -125,8 +139,13 @@ async def fetch_github_deep(
     }
 
 
-async def fetch_reddit_user_about(*, username: str, settings: AppSettings | None = None) -> dict[str, Any] | None:
-    settings = settings or AppSettings()
+async def fetch_reddit_user_about(
+    *,
+    username: str,
+    settings: AppSettings | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> dict[str, Any] | None:
+    settings = settings or get_settings()
     url = f"https://www.reddit.com/user/{username}/about.json"
 
     # Reddit suele exigir UA decente.
@@ -136,8 +155,8 @@ async def fetch_reddit_user_about(*, username: str, settings: AppSettings | None
         "User-Agent": "Mozilla/5.0 (compatible; OSINT-D2/1.0)",
     }
 
-    async with build_async_client(settings, extra_headers=headers) as client:
-        resp = await client.get(url)
+    async with client_scope(client, settings) as c:
+        resp = await c.get(url, headers=headers)
 
     if resp.status_code == 404:
         return None
@@ -181,6 +200,7 @@ async def fetch_reddit_recent_comments(
     username: str,
     limit: int = 10,
     settings: AppSettings | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any] | None:
     """Extrae comentarios recientes (texto crudo + subreddit).
 
@@ -189,7 +209,7 @@ async def fetch_reddit_recent_comments(
     - Puede devolver 429/403 dependiendo de Reddit.
     """
 
-    settings = settings or AppSettings()
+    settings = settings or get_settings()
     url = f"https://www.reddit.com/user/{username}/comments.json?limit={max(1, int(limit))}"
     headers = {
         "Accept": "application/json",
@@ -197,8 +217,8 @@ async def fetch_reddit_recent_comments(
     }
 
     try:
-        async with build_async_client(settings, extra_headers=headers) as client:
-            resp = await client.get(url)
+        async with client_scope(client, settings) as c:
+            resp = await c.get(url, headers=headers)
         if resp.status_code != 200:
             return None
         data = resp.json()
@@ -244,15 +264,21 @@ async def fetch_reddit_deep(
     username: str,
     limit_comments: int = 10,
     settings: AppSettings | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any] | None:
     """Combina about.json + comentarios recientes."""
 
-    settings = settings or AppSettings()
-    about = await fetch_reddit_user_about(username=username, settings=settings)
+    settings = settings or get_settings()
+    about = await fetch_reddit_user_about(username=username, settings=settings, client=client)
     if about is None:
         return None
 
-    comments = await fetch_reddit_recent_comments(username=username, limit=limit_comments, settings=settings)
+    comments = await fetch_reddit_recent_comments(
+        username=username,
+        limit=limit_comments,
+        settings=settings,
+        client=client,
+    )
     return {
         **about,
         **(comments or {}),
@@ -3,53 +3,97 @@
 from __future__ import annotations
 
 import asyncio
+from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from adapters.http_client import build_async_client
-from adapters.report_exporter import export_person_pdf
-from core.config import AppSettings
-from core.domain.language import Language
-from core.domain.models import PersonEntity
+if TYPE_CHECKING:
+    import httpx
+
+    from core.config import AppSettings
 
 app = typer.Typer(no_args_is_help=True, help="Environment diagnostics and configuration checks.")
 
 _console = Console()
 
 
-async def _check_http(url: str) -> tuple[bool, str]:
+async def _check_http(client: httpx.AsyncClient, url: str) -> tuple[bool, str]:
     try:
-        async with build_async_client() as client:
-            response = await client.get(url)
+        response = await client.get(url)
         return True, f"HTTP {response.status_code}"
     except Exception as exc:
         return False, str(exc)
 
 
-def _check_pdf() -> tuple[bool, str]:
-    """Attempt to generate a minimal PDF to detect WeasyPrint issues."""
+def _check_pdf(deep: bool = False) -> tuple[bool, str]:
+    """Render a tiny in-memory PDF to detect WeasyPrint issues.
+
+    A one-line document exercises the same native stack (Pango/Cairo, fonts)
+    as a real dossier. `deep=True` renders the full report template instead.
+    """
 
     try:
-        tmp = Path("reports") / "_doctor_test.pdf"
-        person = PersonEntity(target="doctor", profiles=[])
-        export_person_pdf(person=person, output_path=tmp, language=Language.ENGLISH)
-        try:
-            tmp.unlink(missing_ok=True)
-        except Exception:
-            pass
+        if deep:
+            from adapters.report_exporter import export_person_pdf
+            from core.domain.language import Language
+            from core.domain.models import PersonEntity
+
+            tmp = Path("reports") / "_doctor_test.pdf"
+            person = PersonEntity(target="doctor", profiles=[])
+            export_person_pdf(person=person, output_path=tmp, language=Language.ENGLISH)
+            try:
+                tmp.unlink(missing_ok=True)
+            except Exception:
+                pass
+        else:
+            from weasyprint import HTML
+
+            HTML(string="<p>ok</p>").write_pdf(target=BytesIO())
         return True, "OK"
     except Exception as exc:
         return False, str(exc)
 
 
+async def _all_checks(settings: AppSettings, *, deep: bool = False) -> dict[str, tuple[bool, str]]:
+    """Run the runtime checks under a single event loop and HTTP client.
+
+    The PDF check is blocking (WeasyPrint), so it runs in a worker thread
+    while the connectivity probe is in flight.
+    """
+
+    from adapters.http_client import build_async_client
+
+    async with build_async_client(settings) as client:
+        (ok_http, detail_http), (ok_pdf, detail_pdf) = await asyncio.gather(
+            _check_http(client, "https://github.com"),
+            asyncio.to_thread(_check_pdf, deep),
+        )
+    return {
+        "HTTP connectivity": (ok_http, detail_http),
+        "WeasyPrint PDF": (ok_pdf, detail_pdf),
+    }
+
+
 @app.command()
-def run() -> None:
+def run(
+    deep: bool = typer.Option(
+        False,
+        "--deep/--no-deep",
+        help="Render the full report template in the PDF check (slower).",
+    ),
+) -> None:
     """Run baseline diagnostics and show recommended fixes."""
 
-    settings = AppSettings()
+    # Imported here so `doctor --help` (and the root help, which lists this
+    # sub-app) does not load httpx, the settings model or Rich tables.
+    from rich.table import Table
+
+    from core.config import get_settings
+
+    settings = get_settings()
 
     table = Table(title="OSINT-D2 Doctor")
     table.add_column("Check", style="bright_green", no_wrap=True)
@@ -65,16 +109,14 @@ def run() -> None:
     table.add_row("AI base_url", "OK", settings.ai_base_url)
     table.add_row("AI model", "OK", settings.ai_model)
 
-    # Connectivity (best-effort)
-    ok_http, detail_http = asyncio.run(_check_http("https://github.com"))
-    table.add_row("HTTP connectivity", "OK" if ok_http else "FAIL", detail_http)
-
-    # PDF
-    ok_pdf, detail_pdf = _check_pdf()
-    table.add_row("WeasyPrint PDF", "OK" if ok_pdf else "FAIL", detail_pdf)
+    # Connectivity (best-effort) + PDF
+    results = asyncio.run(_all_checks(settings, deep=deep))
+    for name, (ok, detail) in results.items():
+        table.add_row(name, "OK" if ok else "FAIL", detail)
 
     _console.print(table)
 
+    ok_pdf, _ = results["WeasyPrint PDF"]
     if not ok_pdf:
         _console.print(
             "\n[yellow]Note:[/yellow] When PDF export fails, `--export-pdf` automatically falls back to HTML."
@@ -7,51 +7,40 @@ Why Typer + Rich:
 Architecture note:
 - This layer *orchestrates*; it does not embed scraping or business rules.
 - Any I/O heavy operation lives in async helpers executed through
-    `asyncio.run(...)` so Typer commands remain synchronous.
+    `_run(...)` (one event loop per process) so Typer commands remain
+    synchronous.
 """
 
 from __future__ import annotations
 
 import asyncio
+import atexit
 import errno
-import json
 import os
+import re
 import signal
 import sys
 from contextlib import suppress
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import typer
 from rich.console import Console
-from rich.prompt import Confirm, IntPrompt, Prompt
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeElapsedColumn,
-    TimeRemainingColumn,
-)
 
-from adapters.ai_analyst import analyze_person
-from adapters.json_exporter import export_person_json
-from adapters.report_exporter import export_person_html, export_person_pdf
-from cli.doctor import app as doctor_app
-from cli.ui_components import build_analysis_panel, build_profiles_table, print_banner
-from core.config import AppSettings
-from core.domain.language import Language
-from core.domain.models import PersonEntity
-from core.resources_loader import get_default_list_path
-from core.services.identity_pipeline import (
-    HuntRequest,
-    PipelineHooks,
-    SiteListOptions,
-    sanitize_target_for_filename,
-    hunt as run_hunt_pipeline,
-    scan_email as run_email_pipeline,
-    scan_username as run_username_pipeline,
-)
+# Adapters (HTTP clients, AI SDK, WeasyPrint/Jinja) and the pipeline are
+# imported inside the commands that use them, so `--help`, completion and
+# `doctor` do not pay for them.
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Coroutine
+    from types import ModuleType
+
+    from rich.progress import Progress
+
+    from core.config import AppSettings
+    from core.domain.language import Language
+    from core.domain.models import PersonEntity
 
 app = typer.Typer(
     name="osint-d2",
@@ -68,9 +57,156 @@ app = typer.Typer(
         "Use `osint-d2 <command> --help` for detailed flags."
     ),
 )
-app.add_typer(doctor_app, name="doctor")
 
-_console = Console()
+_console: Console | None = None
+_ui_module: ModuleType | None = None
+_loop: asyncio.AbstractEventLoop | None = None
+
+_T = TypeVar("_T")
+
+
+def _close_loop() -> None:
+    if _loop is None or _loop.is_closed():
+        return
+    with suppress(Exception):
+        _loop.run_until_complete(_loop.shutdown_asyncgens())
+        _loop.run_until_complete(_loop.shutdown_default_executor())
+    _loop.close()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    # uvloop is optional (not a dependency): faster selector loop where it is
+    # installed, the stdlib loop everywhere else (e.g. Windows).
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _run(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run `coro` on the process-wide event loop.
+
+    Unlike `asyncio.run`, the loop (selector, default executor) is created
+    once and reused by every command in the process, e.g. the wizard
+    falling through to a hunt. It is closed at interpreter exit.
+    """
+
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = _new_event_loop()
+        atexit.register(_close_loop)
+    return _loop.run_until_complete(coro)
+
+
+def _get_console() -> Console:
+    """Return the shared stdout console, creating it on first use."""
+
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+
+@lru_cache(maxsize=1)
+def _err_console() -> Console:
+    """Shared stderr console for JSON/piped runs (warnings, errors).
+
+    Markup stays on (messages use `[yellow]`/`[red]`); repr highlighting and
+    emoji substitution are off, they only add regex passes per line.
+    """
+
+    return Console(stderr=True, highlight=False, emoji=False)
+
+
+def _settings() -> AppSettings:
+    """Process-wide settings (env + .env are read once, see `get_settings`)."""
+
+    from core.config import get_settings
+
+    return get_settings()
+
+
+# The standard streams are not swapped mid-run: one isatty() (fstat) each per
+# process, and every command sees the same answer.
+@lru_cache(maxsize=1)
+def _stdin_is_tty() -> bool:
+    return sys.stdin.isatty()
+
+
+@lru_cache(maxsize=1)
+def _stdout_is_tty() -> bool:
+    return sys.stdout.isatty()
+
+
+def _ui() -> ModuleType:
+    """Return `cli.ui_components`, importing it on first use.
+
+    JSON runs never render a banner, table or panel, so they skip it.
+    """
+
+    global _ui_module
+    if _ui_module is None:
+        import cli.ui_components as ui_components
+
+        _ui_module = ui_components
+    return _ui_module
+
+
+def _register_lazy_subcommands(argv: list[str]) -> None:
+    """Attach `doctor` unless argv clearly targets another command.
+
+    `doctor` is skipped only when the first positional argument names one of
+    the root commands, so help screens, completion and `doctor` itself still
+    see the full command tree.
+    """
+
+    first = next((arg for arg in argv if not arg.startswith("-")), None)
+    if first in {name for name, _ in _root_commands()}:
+        return
+
+    from cli.doctor import app as doctor_app
+
+    app.add_typer(doctor_app, name="doctor")
+
+
+def _root_commands() -> list[tuple[str, str]]:
+    """`(name, help)` of the commands registered on `app` (without `doctor`)."""
+
+    return [
+        (c.name or c.callback.__name__.replace("_", "-"), c.help or "")
+        for c in app.registered_commands
+        if c.callback
+    ]
+
+
+def _root_help() -> str:
+    """Plain-text root help for `osint-d2 --help`, built without the Click tree.
+
+    Commands come from `app.registered_commands` plus the lazily attached
+    `doctor` group, and the option rows from Typer's completion parameters and
+    Click's help option, so nothing here is a hand-kept copy.
+    """
+
+    import click
+    from click.formatting import HelpFormatter
+    from typer.main import get_install_completion_arguments
+
+    from cli.doctor import app as doctor_app
+
+    ctx = click.Context(click.Command(app.info.name))
+    options = [param.get_help_record(ctx) for param in get_install_completion_arguments()]
+    options.append(ctx.command.get_help_option(ctx).get_help_record(ctx))
+    commands = sorted([*_root_commands(), ("doctor", doctor_app.info.help or "")])
+
+    formatter = HelpFormatter()
+    formatter.write_usage(app.info.name, "[OPTIONS] COMMAND [ARGS]...")
+    formatter.write(f"\n{app.info.help}\n")
+    with formatter.section("Options"):
+        formatter.write_dl([record for record in options if record])
+    with formatter.section("Commands"):
+        formatter.write_dl(commands)
+    return formatter.getvalue()
 
 try:
     signal.signal(signal.SIGPIPE, signal.SIG_DFL)
@@ -81,7 +217,7 @@ except Exception:
 @app.callback(invoke_without_command=True)
 def main(ctx: typer.Context) -> None:
     if ctx.invoked_subcommand is None:
-        if not sys.stdin.isatty() or not sys.stdout.isatty():
+        if not _stdin_is_tty() or not _stdout_is_tty():
             typer.echo(ctx.get_help())
             raise typer.Exit(code=0)
         wizard()
@@ -98,9 +234,39 @@ class NsfwPolicy(str, Enum):
     allow = "allow"
 
 
+# Options shared by scan / scan-email / hunt / analyze, declared once.
+_OPT_SPANISH = typer.Option(
+    None,
+    "--spanish/--english",
+    "-s",
+    help="Switch output language: --spanish for Spanish, --english for English (default).",
+    show_default=False,
+)
+_OPT_EXPORT_PDF = typer.Option(
+    False,
+    "--export-pdf/--no-export-pdf",
+    help="Export a PDF dossier to reports/ (falls back to HTML on failure).",
+)
+_OPT_EXPORT_JSON = typer.Option(
+    False,
+    "--export-json/--no-export-json",
+    help="Export the aggregated entity (profiles + analysis) as JSON in reports/.",
+)
+_OPT_FORMAT = typer.Option(
+    OutputFormat.table,
+    "--format",
+    help="Terminal output format: table or json.",
+)
+_OPT_JSON_RAW = typer.Option(
+    False,
+    "--json-raw/--no-json-raw",
+    help="(--format json) Include analysis.raw with the raw AI provider payload.",
+)
+
+
 def _auto_output_format(output_format: OutputFormat) -> OutputFormat:
-    if output_format == OutputFormat.table and not sys.stdout.isatty():
-        Console(stderr=True).print(
+    if output_format == OutputFormat.table and not _stdout_is_tty():
+        _err_console().print(
             "[yellow]stdout is not a TTY; auto-switching to --format json. Pass --format table to force tables.[/yellow]"
         )
         return OutputFormat.json
@@ -108,64 +274,90 @@ def _auto_output_format(output_format: OutputFormat) -> OutputFormat:
 
 
 def _resolve_language(spanish_flag: bool | None) -> Language:
+    from core.domain.language import Language
+
     if spanish_flag is True:
         return Language.SPANISH
     if spanish_flag is False:
         return Language.ENGLISH
-    return AppSettings().default_language
+    return _settings().default_language
+
+
+def _dump_person_json(*, person: PersonEntity, include_raw: bool) -> bytes:
+    # Serialise straight from the model: no intermediate dict, and bytes go
+    # to stdout's buffer without an extra `str` copy of the whole dossier.
+    exclude = None if include_raw else {"analysis": {"raw"}}
+    return person.model_dump_json(exclude=exclude).encode("utf-8")
 
 
-def _dump_person_json(*, person: PersonEntity, include_raw: bool) -> str:
-    data = person.model_dump(mode="json")
-    if not include_raw:
-        analysis = data.get("analysis")
-        if isinstance(analysis, dict):
-            analysis.pop("raw", None)
-    return json.dumps(data, ensure_ascii=False)
+def _emit_json(payload: bytes) -> None:
+    # Both writes land in stdout's binary buffer; a single flush sends them.
+    out = sys.stdout.buffer
+    out.write(payload)
+    out.write(b"\n")
+    out.flush()
+
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
 
 def _normalize_email(value: str) -> str:
     email = value.strip().lower()
     if "@" not in email:
         raise typer.BadParameter("Invalid email: missing '@'.")
-    local, _, domain = email.partition("@")
-    if not local or not domain or "." not in domain:
+    if not _EMAIL_RE.fullmatch(email):
         raise typer.BadParameter("Invalid email address.")
     return email
 
 
 def _print_profiles_table(*, person: PersonEntity, primary_usernames: list[str]) -> None:
+    from itertools import chain
+    from operator import itemgetter
+
     main_set = {username.lower() for username in primary_usernames if username}
-    main_profiles: list = []
-    extra_profiles: list = []
+    # One pass: lowercase each username once and bin it; the sorts then
+    # reuse that key instead of recomputing it per comparison.
+    main_rows: list[tuple[str, Any]] = []
+    extra_rows: list[tuple[str, Any]] = []
     for profile in person.profiles:
         username_value = (profile.username or "").lower()
         if username_value and username_value in main_set:
-            main_profiles.append(profile)
+            main_rows.append((username_value, profile))
         else:
-            extra_profiles.append(profile)
-
-    main_profiles.sort(key=lambda p: (p.username or "").lower())
-    extra_profiles.sort(key=lambda p: (p.username or "").lower())
-
-    table = build_profiles_table()
-    for profile in main_profiles + extra_profiles:
-        err = ""
-        if isinstance(profile.metadata, dict):
-            maybe_err = profile.metadata.get("error")
-            if isinstance(maybe_err, str):
-                err = maybe_err
-        table.add_row(
+            extra_rows.append((username_value, profile))
+
+    by_username = itemgetter(0)
+    main_rows.sort(key=by_username)
+    extra_rows.sort(key=by_username)
+
+    table = _ui().build_profiles_table()
+    add_row = table.add_row
+    for _, profile in chain(main_rows, extra_rows):
+        # `metadata` is declared `dict[str, Any]` on the model, so no type check.
+        err = profile.metadata.get("error")
+        add_row(
             profile.network_name,
             profile.username,
             "YES" if profile.existe else "NO",
             str(profile.url),
-            err,
+            err if isinstance(err, str) else "",
         )
-    _console.print(table)
+    _get_console().print(table)
+
 
+def _start_pdf_warmup() -> asyncio.Task[None]:
+    """Load WeasyPrint, fonts and the report template in a worker thread.
 
-def _handle_exports(
+    The dossier embeds the AI analysis, so the PDF itself has to wait for it;
+    the one-off export setup does not, and overlaps with the AI call.
+    """
+
+    from adapters.report_exporter import warm_up_pdf_export
+
+    return asyncio.create_task(asyncio.to_thread(warm_up_pdf_export))
+
+
+async def _handle_exports(
     *,
     person: PersonEntity,
     console: Console,
@@ -176,65 +368,81 @@ def _handle_exports(
     if not export_pdf and not export_json:
         return
 
+    from core.services.identity_pipeline import sanitize_target_for_filename
+
     safe_name = sanitize_target_for_filename(person.target)
 
-    if export_pdf:
+    # Each export renders/writes in a worker thread and returns the lines to
+    # print; the files are independent, so both run at once. Printing happens
+    # here afterwards, on the loop thread and in a fixed order.
+    async def pdf_export() -> list[str]:
+        from adapters.report_exporter import export_person_html, export_person_pdf
+
         try:
             out_path = Path("reports") / f"{safe_name}.pdf"
-            export_person_pdf(person=person, output_path=out_path, language=language)
-            console.print(f"\n[green]PDF generated:[/green] {out_path}")
+            await asyncio.to_thread(export_person_pdf, person=person, output_path=out_path, language=language)
+            return [f"\n[green]PDF generated:[/green] {out_path}"]
         except Exception as exc:
-            console.print(f"\n[red]PDF export failed:[/red] {exc}")
+            lines = [f"\n[red]PDF export failed:[/red] {exc}"]
             html_path = Path("reports") / f"{safe_name}.html"
             try:
-                export_person_html(person=person, output_path=html_path, language=language)
-                console.print(f"[yellow]Fallback HTML generated:[/yellow] {html_path}")
+                await asyncio.to_thread(
+                    export_person_html, person=person, output_path=html_path, language=language
+                )
+                lines.append(f"[yellow]Fallback HTML generated:[/yellow] {html_path}")
             except Exception as html_exc:
-                console.print(f"[red]HTML export failed:[/red] {html_exc}")
+                lines.append(f"[red]HTML export failed:[/red] {html_exc}")
+            return lines
+
+    async def json_export() -> list[str]:
+        from adapters.json_exporter import export_person_json
 
-    if export_json:
         try:
             json_path = Path("reports") / f"{safe_name}.json"
-            export_person_json(person=person, output_path=json_path)
-            console.print(f"\n[green]JSON generated:[/green] {json_path}")
+            await asyncio.to_thread(export_person_json, person=person, output_path=json_path)
+            return [f"\n[green]JSON generated:[/green] {json_path}"]
         except Exception as exc:
-            console.print(f"\n[red]JSON export failed:[/red] {exc}")
+            return [f"\n[red]JSON export failed:[/red] {exc}"]
 
+    exports = []
+    if export_pdf:
+        exports.append(pdf_export())
+    if export_json:
+        exports.append(json_export())
 
-async def _hunt_async(
+    for lines in await asyncio.gather(*exports):
+        for line in lines:
+            console.print(line)
+
+
+async def _run_flow(
     *,
-    usernames: list[str] | None,
-    emails: list[str] | None,
+    status_message: str,
+    run_pipeline: Callable[[Console, Callable[[], None]], Awaitable[Any]],
+    primary_targets: Callable[[Any], list[str]],
     deep_analyze: bool,
     export_pdf: bool,
     export_json: bool,
     output_format: OutputFormat,
     include_raw_in_json: bool,
-    scan_localpart: bool,
-    use_site_lists: bool,
-    username_sites_path: Path | None,
-    email_sites_path: Path | None,
-    sites_max_concurrency: int | None,
-    categories: set[str] | None,
-    no_nsfw: bool | None,
-    use_sherlock: bool,
-    strict: bool,
     language: Language,
 ) -> None:
-    if not usernames and not emails:
-        raise typer.BadParameter("Provide at least one username or email to hunt.")
+    """Shared scan / scan-email / hunt flow.
+
+    Banner and spinner, pipeline, profiles table, optional AI analysis,
+    exports and JSON output. `run_pipeline(console, close_status)` returns the
+    pipeline result; `close_status` lets hunt swap the spinner for its
+    Sherlock progress bar. `primary_targets(result)` picks the usernames
+    listed first in the table.
+    """
 
-    output_format = _auto_output_format(output_format)
     human = output_format == OutputFormat.table
-    console = _console if human else Console(stderr=True)
+    console = _get_console() if human else _err_console()
 
     if human:
-        print_banner(console)
+        _ui().print_banner(console)
 
-    settings = AppSettings()
-    status_ctx = console.status("Building aggregated intelligence...", spinner="dots") if human else None
-    progress: Progress | None = None
-    progress_task_id: int | None = None
+    status_ctx = console.status(status_message, spinner="dots") if human else None
 
     def close_status() -> None:
         nonlocal status_ctx
@@ -242,69 +450,19 @@ async def _hunt_async(
             status_ctx.__exit__(None, None, None)
             status_ctx = None
 
-    hooks = PipelineHooks(
-        warning=lambda msg: console.print(f"[yellow]{msg}[/yellow]"),
-    )
-
-    if human:
-        def on_sherlock_start(total: int) -> None:
-            nonlocal progress, progress_task_id
-            if total <= 0:
-                return
-            close_status()
-            progress = Progress(
-                SpinnerColumn(),
-                TextColumn("[bright_green]Sherlock[/bright_green] {task.completed}/{task.total} ({task.percentage:>3.0f}%)"),
-                BarColumn(bar_width=None),
-                TimeElapsedColumn(),
-                TimeRemainingColumn(),
-                console=console,
-                transient=True,
-            )
-            progress.__enter__()
-            progress_task_id = progress.add_task("Sherlock", total=total)
-
-        def on_sherlock_progress(done: int, _total: int, _site: str) -> None:
-            if progress and progress_task_id is not None:
-                progress.update(progress_task_id, completed=done)
-
-        hooks.sherlock_start = on_sherlock_start
-        hooks.sherlock_progress = on_sherlock_progress
-
     if status_ctx:
         status_ctx.__enter__()
     try:
-        request = HuntRequest(
-            usernames=usernames,
-            emails=emails,
-            scan_localpart=scan_localpart,
-            site_lists=SiteListOptions(
-                enabled=use_site_lists,
-                username_path=username_sites_path,
-                email_path=email_sites_path,
-                max_concurrency=sites_max_concurrency,
-                categories=categories,
-                no_nsfw=no_nsfw,
-            ),
-            use_sherlock=use_sherlock,
-            strict=strict,
-        )
-        result = await run_hunt_pipeline(
-            settings=settings,
-            request=request,
-            hooks=hooks,
-        )
+        result = await run_pipeline(console, close_status)
     finally:
         close_status()
-        if progress:
-            progress.__exit__(None, None, None)
 
     person = result.person
-    primary_usernames: list[str] = list(usernames or []) or ([result.usernames[0]] if result.usernames else [])
 
     if human:
-        _print_profiles_table(person=person, primary_usernames=primary_usernames)
+        _print_profiles_table(person=person, primary_usernames=primary_targets(result))
 
+    pdf_warmup = _start_pdf_warmup() if deep_analyze and export_pdf else None
     if deep_analyze:
         await _analyze_async(
             person=person,
@@ -313,8 +471,10 @@ async def _hunt_async(
             include_raw_in_json=include_raw_in_json,
             language=language,
         )
+    if pdf_warmup:
+        await pdf_warmup
 
-    _handle_exports(
+    await _handle_exports(
         person=person,
         console=console,
         export_pdf=export_pdf,
@@ -323,63 +483,146 @@ async def _hunt_async(
     )
 
     if output_format == OutputFormat.json:
-        sys.stdout.write(_dump_person_json(person=person, include_raw=include_raw_in_json))
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        _emit_json(_dump_person_json(person=person, include_raw=include_raw_in_json))
 
 
-async def _scan_async(
+async def _hunt_async(
     *,
-    target: str,
+    usernames: list[str] | None,
+    emails: list[str] | None,
     deep_analyze: bool,
     export_pdf: bool,
     export_json: bool,
     output_format: OutputFormat,
     include_raw_in_json: bool,
+    scan_localpart: bool,
+    use_site_lists: bool,
+    username_sites_path: Path | None,
+    email_sites_path: Path | None,
+    sites_max_concurrency: int | None,
+    categories: frozenset[str] | None,
+    no_nsfw: bool | None,
+    use_sherlock: bool,
+    strict: bool,
     language: Language,
 ) -> None:
-    output_format = _auto_output_format(output_format)
-    human = output_format == OutputFormat.table
-    console = _console if human else Console(stderr=True)
-
-    if human:
-        print_banner(console)
+    if not usernames and not emails:
+        raise typer.BadParameter("Provide at least one username or email to hunt.")
 
-    status_ctx = console.status("Running baseline sources...", spinner="dots") if human else None
-    if status_ctx:
-        status_ctx.__enter__()
-    try:
-        result = await run_username_pipeline(settings=AppSettings(), username=target)
-    finally:
-        if status_ctx:
-            status_ctx.__exit__(None, None, None)
+    from core.services.identity_pipeline import HuntRequest, PipelineHooks, SiteListOptions
+    from core.services.identity_pipeline import hunt as run_hunt_pipeline
 
-    person = result.person
+    human = output_format == OutputFormat.table
 
-    if human:
-        _print_profiles_table(person=person, primary_usernames=[target])
+    async def run_pipeline(console: Console, close_status: Callable[[], None]) -> Any:
+        progress: Progress | None = None
+        progress_task_id: int | None = None
+        # Redraw at most every ~1% of the Sherlock checks, not on every site.
+        progress_step = 1
+        progress_last = 0
 
-    if deep_analyze:
-        await _analyze_async(
-            person=person,
-            output_format=output_format,
-            emit_json=False,
-            include_raw_in_json=include_raw_in_json,
-            language=language,
+        hooks = PipelineHooks(
+            warning=lambda msg: console.print(f"[yellow]{msg}[/yellow]"),
         )
 
-    _handle_exports(
-        person=person,
-        console=console,
+        if human:
+            def on_sherlock_start(total: int) -> None:
+                nonlocal progress, progress_task_id, progress_step, progress_last
+                if total <= 0:
+                    return
+                close_status()
+                from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+                progress_step = max(1, total // 100)
+                progress_last = 0
+
+                progress = Progress(
+                    SpinnerColumn(),
+                    TextColumn("[bright_green]Sherlock[/bright_green] {task.completed}/{task.total} ({task.percentage:>3.0f}%)"),
+                    BarColumn(bar_width=None),
+                    TimeElapsedColumn(),
+                    console=console,
+                    transient=True,
+                    refresh_per_second=4,
+                )
+                progress.__enter__()
+                progress_task_id = progress.add_task("Sherlock", total=total)
+
+            def on_sherlock_progress(done: int, total: int, _site: str) -> None:
+                nonlocal progress_last
+                if progress is None or progress_task_id is None:
+                    return
+                if done - progress_last < progress_step and done < total:
+                    return
+                progress_last = done
+                progress.update(progress_task_id, completed=done)
+
+            hooks.sherlock_start = on_sherlock_start
+            hooks.sherlock_progress = on_sherlock_progress
+
+        try:
+            request = HuntRequest(
+                usernames=usernames,
+                emails=emails,
+                scan_localpart=scan_localpart,
+                site_lists=SiteListOptions(
+                    enabled=use_site_lists,
+                    username_path=username_sites_path,
+                    email_path=email_sites_path,
+                    max_concurrency=sites_max_concurrency,
+                    categories=categories,
+                    no_nsfw=no_nsfw,
+                ),
+                use_sherlock=use_sherlock,
+                strict=strict,
+            )
+            return await run_hunt_pipeline(
+                settings=_settings(),
+                request=request,
+                hooks=hooks,
+            )
+        finally:
+            if progress:
+                progress.__exit__(None, None, None)
+
+    await _run_flow(
+        status_message="Building aggregated intelligence...",
+        run_pipeline=run_pipeline,
+        primary_targets=lambda result: list(usernames or []) or (
+            [result.usernames[0]] if result.usernames else []
+        ),
+        deep_analyze=deep_analyze,
         export_pdf=export_pdf,
         export_json=export_json,
+        output_format=output_format,
+        include_raw_in_json=include_raw_in_json,
         language=language,
     )
 
-    if output_format == OutputFormat.json:
-        sys.stdout.write(_dump_person_json(person=person, include_raw=include_raw_in_json))
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+
+async def _scan_async(
+    *,
+    target: str,
+    deep_analyze: bool,
+    export_pdf: bool,
+    export_json: bool,
+    output_format: OutputFormat,
+    include_raw_in_json: bool,
+    language: Language,
+) -> None:
+    from core.services.identity_pipeline import scan_username as run_username_pipeline
+
+    await _run_flow(
+        status_message="Running baseline sources...",
+        run_pipeline=lambda _console, _close: run_username_pipeline(settings=_settings(), username=target),
+        primary_targets=lambda _result: [target],
+        deep_analyze=deep_analyze,
+        export_pdf=export_pdf,
+        export_json=export_json,
+        output_format=output_format,
+        include_raw_in_json=include_raw_in_json,
+        language=language,
+    )
 
 
 async def _scan_email_async(
@@ -393,53 +636,24 @@ async def _scan_email_async(
     scan_localpart: bool,
     language: Language,
 ) -> None:
-    output_format = _auto_output_format(output_format)
-    human = output_format == OutputFormat.table
-    console = _console if human else Console(stderr=True)
-
-    if human:
-        print_banner(console)
+    from core.services.identity_pipeline import scan_email as run_email_pipeline
 
-    status_ctx = console.status("Scanning email intelligence sources...", spinner="dots") if human else None
-    if status_ctx:
-        status_ctx.__enter__()
-    try:
-        result = await run_email_pipeline(
-            settings=AppSettings(),
+    await _run_flow(
+        status_message="Scanning email intelligence sources...",
+        run_pipeline=lambda _console, _close: run_email_pipeline(
+            settings=_settings(),
             email=email,
             scan_localpart=scan_localpart,
-        )
-    finally:
-        if status_ctx:
-            status_ctx.__exit__(None, None, None)
-
-    person = result.person
-
-    if human:
-        _print_profiles_table(person=person, primary_usernames=[email])
-
-    if deep_analyze:
-        await _analyze_async(
-            person=person,
-            output_format=output_format,
-            emit_json=False,
-            include_raw_in_json=include_raw_in_json,
-            language=language,
-        )
-
-    _handle_exports(
-        person=person,
-        console=console,
+        ),
+        primary_targets=lambda _result: [email],
+        deep_analyze=deep_analyze,
         export_pdf=export_pdf,
         export_json=export_json,
+        output_format=output_format,
+        include_raw_in_json=include_raw_in_json,
         language=language,
     )
 
-    if output_format == OutputFormat.json:
-        sys.stdout.write(_dump_person_json(person=person, include_raw=include_raw_in_json))
-        sys.stdout.write("\n")
-        sys.stdout.flush()
-
 
 async def _analyze_async(
     *,
@@ -449,12 +663,14 @@ async def _analyze_async(
     include_raw_in_json: bool,
     language: Language,
 ) -> None:
+    from adapters.ai_analyst import analyze_person
+
     human = output_format == OutputFormat.table
-    console = _console if human else Console(stderr=True)
+    console = _get_console() if human else _err_console()
 
-    settings = AppSettings()
+    settings = _settings()
     if human:
-        print_banner(console)
+        _ui().print_banner(console)
 
     try:
         status = console.status(
@@ -471,18 +687,14 @@ async def _analyze_async(
                 status.__exit__(None, None, None)
 
         if human:
-            console.print(build_analysis_panel(report))
+            console.print(_ui().build_analysis_panel(report))
         elif emit_json:
-            sys.stdout.write(_dump_person_json(person=person, include_raw=include_raw_in_json))
-            sys.stdout.write("\n")
-            sys.stdout.flush()
+            _emit_json(_dump_person_json(person=person, include_raw=include_raw_in_json))
     except Exception as exc:
         console.print(f"\n[red]AI analysis failed:[/red] {exc}")
 
     if output_format == OutputFormat.json and not human:
-        sys.stdout.write(_dump_person_json(person=person, include_raw=include_raw_in_json))
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        _emit_json(_dump_person_json(person=person, include_raw=include_raw_in_json))
 
 
 @app.command(help="Quick username sweep across the default intelligence sources.")
@@ -493,37 +705,15 @@ def scan(
         "--deep-analyze/--no-deep-analyze",
         help="Run the cognitive AI analysis (DeepSeek) on top of collected evidence.",
     ),
-    spanish: bool | None = typer.Option(
-        None,
-        "--spanish/--english",
-        "-s",
-        help="Switch output language: --spanish for Spanish, --english for English (default).",
-        show_default=False,
-    ),
-    export_pdf: bool = typer.Option(
-        False,
-        "--export-pdf/--no-export-pdf",
-        help="Export a PDF dossier to reports/ (falls back to HTML on failure).",
-    ),
-    export_json: bool = typer.Option(
-        False,
-        "--export-json/--no-export-json",
-        help="Export the aggregated entity (profiles + analysis) as JSON in reports/.",
-    ),
-    output_format: OutputFormat = typer.Option(
-        OutputFormat.table,
-        "--format",
-        help="Terminal output format: table or json.",
-    ),
-    json_raw: bool = typer.Option(
-        False,
-        "--json-raw/--no-json-raw",
-        help="(--format json) Include analysis.raw with the raw AI provider payload.",
-    ),
+    spanish: bool | None = _OPT_SPANISH,
+    export_pdf: bool = _OPT_EXPORT_PDF,
+    export_json: bool = _OPT_EXPORT_JSON,
+    output_format: OutputFormat = _OPT_FORMAT,
+    json_raw: bool = _OPT_JSON_RAW,
 ) -> None:
     output_format = _auto_output_format(output_format)
     language = _resolve_language(spanish)
-    asyncio.run(
+    _run(
         _scan_async(
             target=target,
             deep_analyze=deep_analyze,
@@ -549,38 +739,16 @@ def scan_email(
         "--scan-localpart/--no-scan-localpart",
         help="Also try the username derived from the local part across username sources.",
     ),
-    spanish: bool | None = typer.Option(
-        None,
-        "--spanish/--english",
-        "-s",
-        help="Switch output language: --spanish for Spanish, --english for English (default).",
-        show_default=False,
-    ),
-    export_json: bool = typer.Option(
-        False,
-        "--export-json/--no-export-json",
-        help="Export the aggregated entity (profiles + analysis) as JSON in reports/.",
-    ),
-    export_pdf: bool = typer.Option(
-        False,
-        "--export-pdf/--no-export-pdf",
-        help="Export a PDF dossier (falls back to HTML on failure).",
-    ),
-    output_format: OutputFormat = typer.Option(
-        OutputFormat.table,
-        "--format",
-        help="Terminal output format: table or json.",
-    ),
-    json_raw: bool = typer.Option(
-        False,
-        "--json-raw/--no-json-raw",
-        help="(--format json) Include analysis.raw with the raw AI provider payload.",
-    ),
+    spanish: bool | None = _OPT_SPANISH,
+    export_json: bool = _OPT_EXPORT_JSON,
+    export_pdf: bool = _OPT_EXPORT_PDF,
+    output_format: OutputFormat = _OPT_FORMAT,
+    json_raw: bool = _OPT_JSON_RAW,
 ) -> None:
     normalized = _normalize_email(email)
     output_format = _auto_output_format(output_format)
     language = _resolve_language(spanish)
-    asyncio.run(
+    _run(
         _scan_email_async(
             email=normalized,
             deep_analyze=deep_analyze,
@@ -638,7 +806,7 @@ def hunt(
         "--sites-max-concurrency",
         min=1,
         max=500,
-        help="Max concurrency for site-lists (defaults to OSINT_D2_SITES_MAX_CONCURRENCY).",
+        help="Max concurrent requests per hunt phase: scanners, site-lists, Sherlock (defaults to OSINT_D2_SITES_MAX_CONCURRENCY).",
     ),
     category: list[str] | None = typer.Option(
         None,
@@ -650,33 +818,11 @@ def hunt(
         "--nsfw",
         help="NSFW policy for site-lists: inherit|exclude|allow.",
     ),
-    spanish: bool | None = typer.Option(
-        None,
-        "--spanish/--english",
-        "-s",
-        help="Switch output language: --spanish for Spanish, --english for English (default).",
-        show_default=False,
-    ),
-    export_json: bool = typer.Option(
-        False,
-        "--export-json/--no-export-json",
-        help="Export the aggregated entity (profiles + analysis) as JSON in reports/.",
-    ),
-    export_pdf: bool = typer.Option(
-        False,
-        "--export-pdf/--no-export-pdf",
-        help="Export a PDF dossier (falls back to HTML on failure).",
-    ),
-    output_format: OutputFormat = typer.Option(
-        OutputFormat.table,
-        "--format",
-        help="Terminal output format: table or json.",
-    ),
-    json_raw: bool = typer.Option(
-        False,
-        "--json-raw/--no-json-raw",
-        help="(--format json) Include analysis.raw with the raw AI provider payload.",
-    ),
+    spanish: bool | None = _OPT_SPANISH,
+    export_json: bool = _OPT_EXPORT_JSON,
+    export_pdf: bool = _OPT_EXPORT_PDF,
+    output_format: OutputFormat = _OPT_FORMAT,
+    json_raw: bool = _OPT_JSON_RAW,
     sherlock: bool = typer.Option(
         False,
         "--sherlock/--no-sherlock",
@@ -688,8 +834,10 @@ def hunt(
         help="Apply conservative heuristics to trim common false positives (handy with Sherlock).",
     ),
 ) -> None:
-    normalized_emails = [_normalize_email(e) for e in emails] if emails else None
-    categories = {c.strip().lower() for c in (category or []) if c.strip()} or None
+    # dict.fromkeys: drop repeated targets (order-preserving) before the pipeline.
+    normalized_emails = list(dict.fromkeys(_normalize_email(e) for e in emails)) if emails else None
+    usernames = list(dict.fromkeys(u.strip() for u in usernames if u.strip())) if usernames else None
+    categories = frozenset(c.strip().lower() for c in (category or []) if c.strip()) or None
     if nsfw == NsfwPolicy.inherit:
         no_nsfw: bool | None = None
     elif nsfw == NsfwPolicy.exclude:
@@ -699,7 +847,7 @@ def hunt(
 
     output_format = _auto_output_format(output_format)
     language = _resolve_language(spanish)
-    asyncio.run(
+    _run(
         _hunt_async(
             usernames=usernames if usernames else None,
             emails=normalized_emails if normalized_emails else None,
@@ -722,12 +870,78 @@ def hunt(
     )
 
 
-@app.command(help="Step-by-step interactive assistant for newcomers.")
-def wizard() -> None:
-    console = _console
-    print_banner(console)
+def _wizard_from_config(path: Path) -> dict[str, Any]:
+    """Build the wizard's hunt arguments from a JSON answers file.
+
+    Keys mirror the prompts (see `cli.wizard_config.WizardConfig`); missing
+    keys take the same defaults the prompts offer. Any read or validation
+    error surfaces as `typer.BadParameter`.
+    """
+
+    from pydantic import ValidationError
+
+    from cli.wizard_config import WizardConfig
+    from core.resources_loader import get_default_list_path
+
+    try:
+        config = WizardConfig.model_validate_json(path.read_bytes())
+    except OSError as exc:
+        raise typer.BadParameter(f"Cannot read wizard config {path}: {exc}") from exc
+    except ValidationError as exc:
+        problems = "; ".join(
+            f"{'.'.join(str(part) for part in err['loc']) or 'config'}: {err['msg']}" for err in exc.errors()
+        )
+        raise typer.BadParameter(f"Invalid wizard config {path}: {problems}") from exc
+
+    def site_list_path(value: str | None, configured: Path | None, filename: str) -> Path | None:
+        if value:
+            return Path(value)
+        return configured or get_default_list_path(filename)
+
+    settings = _settings()
+    usernames = config.usernames or None
+    emails = [_normalize_email(x) for x in config.emails] or None
+    use_site_lists = config.site_lists
+    language_choice = config.language or settings.default_language.label().lower()
+
+    return {
+        "usernames": usernames,
+        "emails": emails,
+        "language": _resolve_language(language_choice == "spanish"),
+        "use_site_lists": use_site_lists,
+        "use_sherlock": config.sherlock,
+        "strict": config.strict,
+        "username_sites_path": (
+            site_list_path(config.username_sites_path, settings.username_sites_path, "wmn-data.json")
+            if use_site_lists and usernames
+            else None
+        ),
+        "email_sites_path": (
+            site_list_path(config.email_sites_path, settings.email_sites_path, "email-data.json")
+            if use_site_lists and emails
+            else None
+        ),
+        "sites_max_concurrency": (
+            (config.sites_max_concurrency or settings.sites_max_concurrency) if use_site_lists else None
+        ),
+        "no_nsfw": (
+            (settings.sites_no_nsfw if config.no_nsfw is None else config.no_nsfw) if use_site_lists else None
+        ),
+        "categories": (frozenset(c.lower() for c in config.categories) or None) if use_site_lists else None,
+        "scan_localpart": config.scan_localpart if emails else False,
+        "deep_analyze": config.deep_analyze,
+        "export_json": config.export_json,
+        "export_pdf": config.export_pdf,
+    }
+
+
+def _wizard_prompts(console: Console) -> dict[str, Any]:
+    from rich.prompt import Confirm, IntPrompt, Prompt
+
+    from core.resources_loader import get_default_list_path
+
+    settings = _settings()
 
-    settings = AppSettings()
     mode = Prompt.ask(
         "What do you want to hunt?",
         choices=["username", "email", "both"],
@@ -745,7 +959,7 @@ def wizard() -> None:
 
     if mode in ("email", "both"):
         e = Prompt.ask("Comma-separated emails", default="").strip()
-        emails = [_normalize_email(x.strip()) for x in e.split(",") if x.strip()] if e else None
+        emails = [_normalize_email(x) for x in e.split(",") if x.strip()] if e else None
     else:
         emails = None
 
@@ -759,7 +973,7 @@ def wizard() -> None:
         choices=["english", "spanish"],
         default=default_language,
     )
-    language = Language.SPANISH if language_choice == "spanish" else Language.ENGLISH
+    language = _resolve_language(language_choice == "spanish")
 
     use_site_lists = Confirm.ask("Enable large site-lists engine?", default=False)
     use_sherlock = Confirm.ask("Enable Sherlock (400+ sites)?", default=False)
@@ -769,7 +983,7 @@ def wizard() -> None:
     email_sites_path: Path | None = None
     sites_max_concurrency: int | None = None
     no_nsfw: bool | None = None
-    category: set[str] | None = None
+    category: frozenset[str] | None = None
 
     if use_site_lists:
         if usernames:
@@ -800,7 +1014,7 @@ def wizard() -> None:
         no_nsfw = Confirm.ask("Exclude NSFW categories?", default=bool(settings.sites_no_nsfw))
         cats = Prompt.ask("Categories (optional, comma-separated)", default="").strip()
         if cats:
-            category = {c.strip().lower() for c in cats.split(",") if c.strip()} or None
+            category = frozenset(c.strip().lower() for c in cats.split(",") if c.strip()) or None
 
     scan_localpart = False
     if emails:
@@ -810,25 +1024,47 @@ def wizard() -> None:
     export_json = Confirm.ask("Export JSON to reports/?", default=False)
     export_pdf = Confirm.ask("Export PDF/HTML to reports/?", default=False)
 
-    asyncio.run(
+    return {
+        "usernames": usernames,
+        "emails": emails,
+        "language": language,
+        "use_site_lists": use_site_lists,
+        "use_sherlock": use_sherlock,
+        "strict": strict,
+        "username_sites_path": username_sites_path,
+        "email_sites_path": email_sites_path,
+        "sites_max_concurrency": sites_max_concurrency,
+        "no_nsfw": no_nsfw,
+        "categories": category,
+        "scan_localpart": scan_localpart,
+        "deep_analyze": deep_analyze,
+        "export_json": export_json,
+        "export_pdf": export_pdf,
+    }
+
+
+@app.command(help="Step-by-step interactive assistant for newcomers.")
+def wizard() -> None:
+    console = _get_console()
+
+    config_path = os.environ.get("OSINT_D2_WIZARD_CONFIG")
+    if config_path:
+        # Validate the config before drawing anything: bad input exits fast.
+        answers = _wizard_from_config(Path(config_path))
+        if not answers["usernames"] and not answers["emails"]:
+            console.print("[red]Need at least one username or email.[/red]")
+            raise typer.Exit(code=2)
+        _ui().print_banner(console)
+    else:
+        # Interactive: the banner introduces the prompts, so it goes first.
+        _ui().print_banner(console)
+        answers = _wizard_prompts(console)
+
+    _run(
         _hunt_async(
-            usernames=usernames,
-            emails=emails,
-            deep_analyze=deep_analyze,
-            export_pdf=export_pdf,
-            export_json=export_json,
-            output_format=OutputFormat.table,
+            **answers,
+            output_format=_auto_output_format(OutputFormat.table),
             include_raw_in_json=False,
-            scan_localpart=scan_localpart,
-            use_site_lists=use_site_lists,
-            username_sites_path=username_sites_path,
-            email_sites_path=email_sites_path,
-            sites_max_concurrency=sites_max_concurrency,
-            categories=category,
-            no_nsfw=no_nsfw,
-            use_sherlock=use_sherlock,
-            strict=strict,
-            language=language,
         )
     )
 
@@ -838,29 +1074,17 @@ def analyze(
     input_path: Path = typer.Argument(
         ..., exists=True, dir_okay=False, help="Path to exported JSON (reports/<target>.json)."
     ),
-    output_format: OutputFormat = typer.Option(
-        OutputFormat.table,
-        "--format",
-        help="Terminal output format: table or json.",
-    ),
-    spanish: bool | None = typer.Option(
-        None,
-        "--spanish/--english",
-        "-s",
-        help="Switch output language: --spanish for Spanish, --english for English (default).",
-        show_default=False,
-    ),
-    json_raw: bool = typer.Option(
-        False,
-        "--json-raw/--no-json-raw",
-        help="(--format json) Include analysis.raw with the raw AI provider payload.",
-    ),
+    output_format: OutputFormat = _OPT_FORMAT,
+    spanish: bool | None = _OPT_SPANISH,
+    json_raw: bool = _OPT_JSON_RAW,
 ) -> None:
-    raw = input_path.read_text(encoding="utf-8")
-    person = PersonEntity.model_validate_json(raw)
+    from core.domain.models import PersonEntity
+
+    # Bytes straight to the (Rust) JSON parser: no intermediate decoded `str`.
+    person = PersonEntity.model_validate_json(input_path.read_bytes())
     output_format = _auto_output_format(output_format)
     language = _resolve_language(spanish)
-    asyncio.run(
+    _run(
         _analyze_async(
             person=person,
             output_format=output_format,
@@ -872,20 +1096,22 @@ def analyze(
 
 
 def run() -> None:
+    if sys.argv[1:] == ["--help"]:
+        sys.stdout.write(_root_help())
+        raise SystemExit(0)
+    _register_lazy_subcommands(sys.argv[1:])
     try:
         app()
-    except BrokenPipeError:
-        with suppress(Exception):
-            sys.stdout.flush()
+    except OSError as exc:
+        if not isinstance(exc, BrokenPipeError) and exc.errno != errno.EPIPE:
+            raise
+        # Reader went away (`| head`). Point stdout at /dev/null so the
+        # interpreter's final flush does not raise a second BrokenPipeError.
         with suppress(Exception):
             fd = os.open(os.devnull, os.O_WRONLY)
             os.dup2(fd, sys.stdout.fileno())
             os.close(fd)
         raise SystemExit(0)
-    except OSError as exc:
-        if exc.errno == errno.EPIPE:
-            raise SystemExit(0)
-        raise
 
 
 if __name__ == "__main__":
@@ -10,6 +10,18 @@ from rich.text import Text
 
 from core.domain.models import AnalysisReport
 
+# (header, style, extra Column kwargs) for the profiles table.
+_PROFILE_COLUMNS: tuple[tuple[str, str, dict[str, object]], ...] = (
+    ("Network", "bright_green", {"no_wrap": True}),
+    ("Username", "white", {}),
+    ("Exists", "green3", {"width": 6}),
+    ("URL", "green", {}),
+    ("Error", "red", {}),
+)
+
+# Panel copies its title before rendering, so one immutable instance is enough.
+_ANALYSIS_TITLE = Text("AI Analysis", style="bold bright_green")
+
 
 def print_banner(console: Console) -> None:
     """Render the welcome banner for interactive sessions."""
@@ -24,26 +36,21 @@ def build_profiles_table() -> Table:
     """Create the Rich table used to display discovered profiles."""
 
     table = Table(title="Social Profiles", title_style="bright_green")
-    table.add_column("Network", style="bright_green", no_wrap=True)
-    table.add_column("Username", style="white")
-    table.add_column("Exists", style="green3")
-    table.add_column("URL", style="green")
-    table.add_column("Error", style="red")
+    for header, style, extra in _PROFILE_COLUMNS:
+        table.add_column(header, style=style, **extra)
     return table
 
 
 def build_analysis_panel(report: AnalysisReport) -> Panel:
     """Render the AI analysis report in a Rich panel."""
 
-    title = Text("AI Analysis", style="bold bright_green")
     body = Text()
     body.append(report.summary.strip() + "\n\n")
     if report.highlights:
         body.append("Highlights:\n", style="bold bright_green")
-        for h in report.highlights:
-            body.append(f"- {h}\n")
+        body.append("".join(f"- {h}\n" for h in report.highlights))
     body.append(f"\nConfidence: {report.confidence:.2f}")
     if report.model:
         body.append(f"\nModel: {report.model}", style="dim")
 
-    return Panel(body, title=title, border_style="bright_green")
+    return Panel(body, title=_ANALYSIS_TITLE, border_style="bright_green")
@@ -0,0 +1,53 @@
+"""Answers file for scripted `wizard` runs (`OSINT_D2_WIZARD_CONFIG`).
+
+Kept out of `cli.main` so pydantic is only imported when a config is used.
+"""
+
+from __future__ import annotations
+
+from typing import Annotated, Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr, field_validator
+
+
+class WizardConfig(BaseModel):
+    """One key per wizard prompt; missing keys take the prompts' defaults.
+
+    Flags must be JSON booleans (`"false"` is rejected, not read as true) and
+    `sites_max_concurrency` follows the same 1..500 bound as
+    `--sites-max-concurrency`. Unknown keys are rejected so a typo does not
+    silently fall back to a default.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    usernames: list[StrictStr] = Field(default_factory=list)
+    emails: list[StrictStr] = Field(default_factory=list)
+    language: Literal["english", "spanish"] | None = None
+    site_lists: StrictBool = False
+    sherlock: StrictBool = False
+    strict: StrictBool = False
+    username_sites_path: StrictStr | None = None
+    email_sites_path: StrictStr | None = None
+    sites_max_concurrency: Annotated[StrictInt, Field(ge=1, le=500)] | None = None
+    no_nsfw: StrictBool | None = None
+    categories: list[StrictStr] = Field(default_factory=list)
+    scan_localpart: StrictBool = True
+    deep_analyze: StrictBool = True
+    export_json: StrictBool = False
+    export_pdf: StrictBool = False
+
+    @field_validator("usernames", "emails", "categories", mode="before")
+    @classmethod
+    def _split_comma_separated(cls, value: Any) -> Any:
+        # Lists may also be written as a single "a, b" string, like the prompts.
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return value.split(",")
+        return value
+
+    @field_validator("usernames", "emails", "categories")
+    @classmethod
+    def _drop_blank(cls, value: list[str]) -> list[str]:
+        return [x.strip() for x in value if x.strip()]
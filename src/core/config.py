@@ -9,6 +9,7 @@ Nota: se implementará en la siguiente iteración.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field
@@ -44,6 +45,14 @@ class AppSettings(BaseSettings):
         description="User-Agent para peticiones OSINT.",
     )
 
+    http_cache_dir: Path | None = Field(
+        default=None,
+        description=(
+            "Directorio para la caché HTTP (ETag/Last-Modified) vía `hishel`. "
+            "Si no se define o `hishel` no está instalado, no se cachea."
+        ),
+    )
+
     ai_api_key: str | None = Field(
         default=None,
         description="API key para el proveedor IA (DeepSeek compatible OpenAI).",
@@ -76,7 +85,7 @@ class AppSettings(BaseSettings):
         default=30,
         ge=1,
         le=500,
-        description="Concurrencia máxima para el motor data-driven de listas de sitios.",
+        description="Concurrencia máxima por fase del hunt (scanners, site-lists, Sherlock).",
     )
     sites_no_nsfw: bool = Field(
         default=True,
@@ -95,3 +104,15 @@ class AppSettings(BaseSettings):
         default=Language.ENGLISH,
         description="Idioma por defecto para prompts y reportes (en/es).",
     )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """Devuelve la configuración del proceso (env + `.env` leídos una sola vez).
+
+    Los adaptadores la usan como fallback cuando no reciben `settings`:
+    instanciar `AppSettings()` vuelve a leer el entorno y el `.env` y a validar
+    todos los campos.
+    """
+
+    return AppSettings()